@@ -0,0 +1,4 @@
+"""Пакет для размещения бенчмарков производительности приложения
+Онлайн-калькулятор. Бенчмарки запускаются как модули, например:
+python -m benchmarks.listing_latency
+"""
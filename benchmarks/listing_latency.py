@@ -0,0 +1,73 @@
+"""Бенчмарк измеряет задержку получения списка алгоритмов без нагрузки
+и во время одновременного выполнения ресурсоемких вызовов алгоритма fibonacci."""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from src.config import Settings
+from src.internal.constants import ALGORITHMS_ENDPOINT
+from src.main import create_app
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Возвращает перцентиль для списка значений."""
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+async def measure_listing(client: httpx.AsyncClient, requests: int) -> list[float]:
+    """Выполняет последовательные запросы списка алгоритмов и возвращает
+    задержки в миллисекундах."""
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(ALGORITHMS_ENDPOINT + "/")
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+    return latencies
+
+
+async def heavy_call(client: httpx.AsyncClient, n: int) -> None:
+    """Выполняет ресурсоемкий вызов алгоритма fibonacci."""
+    response = await client.post(
+        ALGORITHMS_ENDPOINT + "/fibonacci/results", json=[{"name": "n", "value": n}]
+    )
+    assert response.status_code == 200
+
+
+async def run(args: argparse.Namespace) -> None:
+    settings = Settings(
+        EXECUTE_TIMEOUT=0,
+        USE_LOGGER=False,
+        EXECUTION_BACKEND=args.backend,
+    )
+    app = create_app(settings)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        idle = await measure_listing(client, args.requests)
+        heavy = [
+            asyncio.ensure_future(heavy_call(client, args.n))
+            for _ in range(args.heavy_calls)
+        ]
+        loaded = await measure_listing(client, args.requests)
+        await asyncio.gather(*heavy)
+    app.state.scheduler.shutdown()
+    app.state.algorithms.shutdown()
+
+    for title, latencies in [("idle", idle), ("loaded", loaded)]:
+        print(
+            f"{title:>6}: p50 = {percentile(latencies, 50):8.2f} ms, "
+            f"p99 = {percentile(latencies, 99):8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="inline", choices=["inline", "process"])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--heavy-calls", type=int, default=4)
+    parser.add_argument("--n", type=int, default=30)
+    asyncio.run(run(parser.parse_args()))
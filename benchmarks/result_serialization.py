@@ -0,0 +1,75 @@
+"""Бенчмарк сравнивает затраты времени на формирование ответа с результатами
+выполнения алгоритма: проверкой элементов данных, повторной проверкой модели
+ответа и обходом jsonable_encoder, как в JSONResponse по умолчанию, и
+сериализацией уже проверенных элементов в FastJSONResponse."""
+
+import argparse
+import json
+import timeit
+import warnings
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.internal.schemas.data_element_schema import (
+    DataElementSchema,
+    DataElementsSchema,
+)
+from src.routers.fast_json import FastJSONResponse, get_elements_content, orjson
+
+
+def default_response(outputs: dict) -> bytes:
+    """Формирует ответ так же, как FastAPI при указании модели ответа."""
+    elements = [
+        DataElementSchema(name=name, value=value) for name, value in outputs.items()
+    ]
+    content = DataElementsSchema.model_validate(jsonable_encoder(elements))
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def fast_response(outputs: dict) -> bytes:
+    """Формирует ответ из проверенных исполнителем алгоритма значений."""
+    elements = [
+        DataElementSchema.model_construct(name=name, value=value)
+        for name, value in outputs.items()
+    ]
+    return FastJSONResponse(get_elements_content(elements)).body
+
+
+def run(args: argparse.Namespace) -> None:
+    warnings.simplefilter("ignore")
+    print(f"orjson: {'yes' if orjson is not None else 'no'}")
+    cases = [
+        ("scalar", {"result": 55}, args.number * 100),
+        (
+            "matrix 100x100",
+            {"result": [[float(i * j) for j in range(100)] for i in range(100)]},
+            args.number,
+        ),
+        (
+            "matrix 1000x1000",
+            {"result": [[float(i * j) for j in range(1000)] for i in range(1000)]},
+            max(args.number // 100, 1),
+        ),
+    ]
+    for title, outputs, number in cases:
+        assert json.loads(default_response(outputs)) == json.loads(
+            fast_response(outputs)
+        )
+        before = min(
+            timeit.repeat(lambda: default_response(outputs), number=number, repeat=3)
+        )
+        after = min(
+            timeit.repeat(lambda: fast_response(outputs), number=number, repeat=3)
+        )
+        print(
+            f"{title:>16}: before = {before / number * 1e3:10.3f} ms, "
+            f"after = {after / number * 1e3:10.3f} ms, "
+            f"speedup = {before / after:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100)
+    run(parser.parse_args())
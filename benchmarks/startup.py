@@ -0,0 +1,50 @@
+"""Бенчмарк измеряет время сборки каталога алгоритмов при последовательном
+и параллельном выполнении тестов, при повторной сборке с сохраненным перечнем
+успешно протестированных алгоритмов и при отложенной загрузке алгоритмов."""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.constants import DEFAULT_ALGORITHMS_CATALOG_PATH
+
+
+def measure(
+    build_workers: int, manifest_path: str = "", lazy_loading: bool = False
+) -> float:
+    """Собирает каталог алгоритмов и возвращает время сборки в секундах."""
+    start = time.perf_counter()
+    algorithms = AlgorithmCollection(
+        DEFAULT_ALGORITHMS_CATALOG_PATH,
+        execute_timeout=0,
+        build_workers=build_workers,
+        build_manifest_path=manifest_path,
+        lazy_loading=lazy_loading,
+    )
+    elapsed = time.perf_counter() - start
+    algorithms.shutdown()
+    return elapsed
+
+
+def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = os.path.join(tmp_dir, "manifest.json")
+        cases = [
+            ("serial", lambda: measure(1)),
+            ("parallel", lambda: measure(args.workers)),
+            ("manifest, cold", lambda: measure(args.workers, manifest_path)),
+            ("manifest, warm", lambda: measure(args.workers, manifest_path)),
+            ("lazy", lambda: measure(args.workers, lazy_loading=True)),
+        ]
+        results = [(title, case()) for title, case in cases]
+
+    for title, elapsed in results:
+        print(f"{title:>16}: {elapsed:8.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=0)
+    run(parser.parse_args())
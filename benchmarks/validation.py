@@ -0,0 +1,87 @@
+"""Бенчмарк сравнивает затраты времени на проверку входных данных алгоритма
+обходом описания с помощью DataDimensionChecker.check_value и скомпилированными
+при создании AlgorithmExecutor функциями проверки."""
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+from src.algorithms.matrix_sub.function import main as matrix_sub
+from src.algorithms.perfect_numbers.function import main as perfect_numbers
+from src.algorithms.quadratic_equation.function import main as quadratic_equation
+from src.internal.algorithm_executor import AlgorithmExecutor
+from src.internal.data_dimension.data_dimension_checker import DataDimensionChecker
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+
+
+def load_executor(name: str, method) -> AlgorithmExecutor:
+    """Создает исполнителя алгоритма по описанию из каталога алгоритмов."""
+    with open(f"src/algorithms/{name}/definition.json", encoding="utf-8") as file:
+        definition = AlgorithmDefinitionSchema.model_validate(json.load(file))
+    return AlgorithmExecutor(definition, method, 0)
+
+
+def generic_validate(executor: AlgorithmExecutor, params: dict[str, Any]) -> None:
+    """Проверяет входные данные обходом описания алгоритма при каждом вызове."""
+    definition = executor.definition
+    for key in params:
+        if key not in [param.name for param in definition.parameters]:
+            raise ValueError(key)
+    for key in [param.name for param in definition.parameters]:
+        if key not in params:
+            raise ValueError(key)
+        param = [param for param in definition.parameters if param.name == key][0]
+        if DataDimensionChecker.check_value(param, params[key]) is not None:
+            raise TypeError(key)
+
+
+def run(args: argparse.Namespace) -> None:
+    size = args.size
+    cases = [
+        (
+            "scalar (quadratic_equation)",
+            load_executor("quadratic_equation", quadratic_equation),
+            {"a": 1.0, "b": 2.0, "c": 1.0},
+        ),
+        (
+            f"list[{size * size}] (perfect_numbers)",
+            load_executor("perfect_numbers", perfect_numbers),
+            {"numbers": list(range(size * size))},
+        ),
+        (
+            f"matrix {size}x{size} (matrix_sub)",
+            load_executor("matrix_sub", matrix_sub),
+            {
+                "n": [[float(i)] * size for i in range(size)],
+                "m": [[float(i)] * size for i in range(size)],
+            },
+        ),
+    ]
+    for title, executor, params in cases:
+        before = min(
+            timeit.repeat(
+                lambda: generic_validate(executor, params),
+                number=args.number,
+                repeat=5,
+            )
+        )
+        after = min(
+            timeit.repeat(
+                lambda: executor.validate_input_values(params),
+                number=args.number,
+                repeat=5,
+            )
+        )
+        print(
+            f"{title:>32}: before = {before / args.number * 1e6:10.2f} us, "
+            f"after = {after / args.number * 1e6:10.2f} us, "
+            f"speedup = {before / after:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    run(parser.parse_args())
@@ -1,7 +1,13 @@
 from pydantic import AnyHttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from src.internal.constants import DEFAULT_ALGORITHMS_CATALOG_PATH
+from src.internal.constants import (
+    DEFAULT_ALGORITHMS_CATALOG_PATH,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_MAX_BATCH_SIZE,
+)
+from src.internal.execution import ExecutionBackendEnum
 
 
 class Settings(BaseSettings):
@@ -10,6 +16,19 @@ class Settings(BaseSettings):
 
     EXECUTE_TIMEOUT: int = 0
     ALGORITHMS_CATALOG_PATH: str = DEFAULT_ALGORITHMS_CATALOG_PATH
+    EXECUTION_BACKEND: ExecutionBackendEnum = ExecutionBackendEnum.INLINE
+    PROCESS_POOL_SIZE: int = 0
+    SCHEDULER_MAX_WORKERS: int = 0
+    SCHEDULER_QUEUE_SIZE: int = 100
+    RESULT_CACHE_SIZE: int = DEFAULT_CACHE_SIZE
+    RESULT_CACHE_TTL: float = DEFAULT_CACHE_TTL
+    BATCH_MAX_SIZE: int = DEFAULT_MAX_BATCH_SIZE
+    BUILD_WORKERS: int = 0
+    BUILD_MANIFEST_PATH: str = ""
+    LAZY_LOADING: bool = False
+    WARM_UP: bool = False
+    CATALOG_WATCH_INTERVAL: float = 0
+    ADMIN_TOKEN: str = ""
     BACKEND_CORS_ORIGINS: list[str | AnyHttpUrl] = ["*"]
     USE_LOGGER: bool = True
     LOG_LEVEL: str = "WARNING"
@@ -1,10 +1,15 @@
 import importlib.util
 import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable
 
 import pytest
 
 from src.internal.algorithm_executor import AlgorithmExecutor
+from src.internal.build_manifest import BuildManifest
 from src.internal.constants import (
     DEFAULT_DEFINITION_FILE_NAME,
     DEFAULT_FUNCTION_FILE_NAME,
@@ -13,12 +18,28 @@ from src.internal.constants import (
 )
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution import ExecutionBackend
+from src.internal.result_cache import ResultCache
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
 
+_tests_lock = threading.Lock()
+"""Блокировка последовательного выполнения тестов в текущем процессе."""
+
+
+def _run_tests(test_file_path: str) -> bool:
+    """Выполняет тесты для алгоритма и возвращает признак их успешного
+    завершения."""
+    return pytest.main(["-q", test_file_path]) == 0
+
 
 class AlgorithmBuilder:
-    """Класс создает экземпляры класса AlgorithmExecutor из пакетов с исходным кодом."""
+    """Класс создает экземпляры класса AlgorithmExecutor из пакетов с исходным кодом.
+
+    При сборке нескольких алгоритмов их тесты выполняются параллельно
+    в отдельных процессах. Если задан путь к перечню сборки, тесты алгоритмов,
+    файлы которых не изменились с последней успешной сборки, не выполняются.
+    """
 
     def __init__(
         self,
@@ -26,6 +47,10 @@ class AlgorithmBuilder:
         function_file_name: str = DEFAULT_FUNCTION_FILE_NAME,
         test_file_name: str = DEFAULT_TEST_FILE_NAME,
         execute_timeout: int = DEFAULT_TIMEOUT,
+        execution_backend: ExecutionBackend | None = None,
+        result_cache: ResultCache | None = None,
+        build_workers: int = 1,
+        manifest_path: str = "",
     ):
         """Конструктор класса
 
@@ -37,12 +62,27 @@ class AlgorithmBuilder:
         :type test_file_name: str
         :param execute_timeout: таймаут выполнения алгоритма;
         :type execute_timeout: int
+        :param execution_backend: механизм выполнения методов алгоритмов;
+        :type execution_backend: ExecutionBackend or None
+        :param result_cache: кэш результатов выполнения алгоритмов;
+        :type result_cache: ResultCache or None
+        :param build_workers: количество процессов для выполнения тестов
+            алгоритмов, 0 - по количеству процессоров, 1 - тесты выполняются
+            последовательно в текущем процессе;
+        :type build_workers: int
+        :param manifest_path: путь к файлу перечня успешно протестированных
+            алгоритмов, пустая строка - тесты выполняются при каждой сборке;
+        :type manifest_path: str
         :raises ValueError: при несоответствии типов данных для параметров.
         """
         self.__definition_file_name: str = definition_file_name
         self.__function_file_name: str = function_file_name
         self.__test_file_name: str = test_file_name
         self.__execute_timeout: int = execute_timeout
+        self.__execution_backend: ExecutionBackend | None = execution_backend
+        self.__result_cache: ResultCache | None = result_cache
+        self.__build_workers: int = build_workers or os.cpu_count() or 1
+        self.__manifest_path: str = manifest_path
         self.__validate()
 
     def build_algorithm(self, path: str) -> AlgorithmExecutor:
@@ -57,19 +97,90 @@ class AlgorithmBuilder:
         :raises RuntimeError: при ошибке выполнения авто тестов для алгоритма;
         :raises FileNotFoundError: при отсутствии файлов с исходным кодом;
         """
+        return self.build_algorithms([path])[0]
+
+    def build_algorithms(self, paths: list[str]) -> list[AlgorithmExecutor]:
+        """Создает экземпляры класса AlgorithmExecutor для алгоритмов,
+        расположенных в указанных каталогах. Тесты алгоритмов выполняются
+        параллельно, ошибки сборки возникают в порядке следования каталогов.
+
+        :param paths: пути к каталогам с файлами исходного кода алгоритмов;
+        :type paths: list[str]
+        :return: экземпляры класса AlgorithmExecutor в порядке каталогов;
+        :rtype: list[AlgorithmExecutor]
+        :raises ValueError: при несоответствии описания алгоритма;
+        :raises RuntimeError: при ошибке выполнения авто тестов для алгоритма;
+        :raises FileNotFoundError: при отсутствии файлов с исходным кодом;
+        """
+        manifest = BuildManifest(self.__manifest_path)
+        definitions: dict[str, AlgorithmDefinitionSchema | Exception] = {}
+        digests: dict[str, str] = {}
+        for path in paths:
+            try:
+                definitions[path] = self.load_definition(path)
+            except Exception as ex:
+                definitions[path] = ex
+                continue
+            digests[path] = self.get_digest(path)
+
+        test_results = self.__test_functions(
+            [path for path in digests if not manifest.is_passed(path, digests[path])]
+        )
+        for path, is_passed in test_results.items():
+            if is_passed:
+                manifest.set_passed(path, digests[path])
+        manifest.save()
+
+        executors = []
+        for path in paths:
+            definition = definitions[path]
+            if isinstance(definition, Exception):
+                raise definition
+            if not test_results.get(path, True):
+                raise RuntimeError(ErrMsg.UNIT_TEST_FAILED)
+            executors.append(
+                AlgorithmExecutor(
+                    definition,
+                    self.__get_function(path),
+                    self.__execute_timeout,
+                    self.__execution_backend,
+                    self.__result_cache,
+                )
+            )
+        return executors
+
+    def get_digest(self, path: str) -> str:
+        """Возвращает хэш содержимого файлов, по которым собирается алгоритм.
+
+        :param path: путь к каталогу с файлами исходного кода для алгоритма;
+        :type path: str
+        :return: хэш содержимого файлов алгоритма.
+        :rtype: str
+        """
+        return BuildManifest.get_digest(
+            [
+                path + "/" + self.__definition_file_name,
+                path + "/" + self.__function_file_name,
+                path + "/" + self.__test_file_name,
+            ]
+        )
+
+    def load_definition(self, path: str) -> AlgorithmDefinitionSchema:
+        """Загружает описание алгоритма из файла без сборки алгоритма.
+
+        :param path: путь к каталогу с файлами исходного кода для алгоритма;
+        :type path: str
+        :return: описание алгоритма;
+        :rtype: AlgorithmDefinitionSchema
+        :raises ValueError: при несоответствии описания алгоритма;
+        :raises FileNotFoundError: при отсутствии файла с описанием.
+        """
         with open(
             path + "/" + self.__definition_file_name, "r", encoding="utf-8"
         ) as def_file:
             definition_json = json.load(def_file)
 
-        algo_definition = AlgorithmDefinitionSchema.model_validate(definition_json)
-
-        if not self.__test_function(path):
-            raise RuntimeError(ErrMsg.UNIT_TEST_FAILED)
-
-        return AlgorithmExecutor(
-            algo_definition, self.__get_function(path), self.__execute_timeout
-        )
+        return AlgorithmDefinitionSchema.model_validate(definition_json)
 
     def __get_function(self, path: str) -> Callable:
         """Импортирует метод алгоритма из файла с исходным кодом."""
@@ -79,11 +190,23 @@ class AlgorithmBuilder:
         spec.loader.exec_module(module)
         return module.main
 
-    def __test_function(self, path: str) -> bool:
-        """Выполняет тесты для алгоритма"""
-        test_file_path = path + "/" + self.__test_file_name
-
-        return pytest.main(["-q", test_file_path]) == 0
+    def __test_functions(self, paths: list[str]) -> dict[str, bool]:
+        """Выполняет тесты для алгоритмов. Если разрешено больше одного
+        процесса, тесты каждого алгоритма выполняются в отдельном новом
+        процессе, иначе последовательно в текущем процессе."""
+        test_file_paths = [path + "/" + self.__test_file_name for path in paths]
+        if not paths:
+            return {}
+        if self.__build_workers == 1:
+            with _tests_lock:
+                return dict(zip(paths, map(_run_tests, test_file_paths)))
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.__build_workers, len(paths)),
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as executor:
+            return dict(zip(paths, executor.map(_run_tests, test_file_paths)))
 
     def __validate(self) -> None:
         """Проверяет валидность созданного экземпляра класса."""
@@ -93,6 +216,8 @@ class AlgorithmBuilder:
             raise TypeError(ErrMsg.NON_INT_TIMEOUT)
         if self.__execute_timeout < 0:
             raise ValueError(ErrMsg.NEG_INT_TIMEOUT)
+        if self.__build_workers < 0:
+            raise ValueError(ErrMsg.NEG_BUILD_WORKERS)
         str_params = [
             ["definition_file_name", self.__definition_file_name],
             ["function_file_name", self.__function_file_name],
@@ -1,24 +1,59 @@
+import logging
 import os
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
 
 from src.internal.algorithm_builder import AlgorithmBuilder
 from src.internal.algorithm_executor import AlgorithmExecutor
 from src.internal.constants import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
     DEFAULT_DEFINITION_FILE_NAME,
     DEFAULT_FUNCTION_FILE_NAME,
+    DEFAULT_MAX_BATCH_SIZE,
     DEFAULT_TEST_FILE_NAME,
     DEFAULT_TIMEOUT,
 )
 from src.internal.errors import ErrorMessageEnum as ErrMsg
-from src.internal.errors.exceptions import AlgorithmNotFoundError
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import (
+    AlgorithmError,
+    AlgorithmNotFoundError,
+    AlgorithmRuntimeError,
+    AlgorithmValueError,
+)
+from src.internal.execution import (
+    ExecutionBackend,
+    ExecutionBackendEnum,
+    InlineExecutionBackend,
+    ProcessPoolExecutionBackend,
+)
+from src.internal.result_cache import ResultCache
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from src.internal.schemas.catalog_reload_schema import CatalogReloadSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
 
+logger = logging.getLogger(__name__)
+
 
 class AlgorithmCollection:
     """Класс представляет собой набор объектов класса AlgorithmExecutor,
     созданных объектом класса AlgorithmBuilder.
 
+    В режиме отложенной загрузки при создании набора загружаются только
+    описания алгоритмов, а импорт модуля, тесты и проверочное выполнение
+    алгоритма выполняются при первом обращении к нему. Время такой сборки
+    сохраняется для каждого алгоритма. Фоновый прогрев собирает алгоритмы
+    заранее, не задерживая запуск приложения.
+
+    Каталог алгоритмов может быть загружен повторно без перезапуска
+    приложения: пересобираются только каталоги алгоритмов, содержимое файлов
+    которых изменилось, и исполнитель алгоритма заменяется целиком. Уже
+    начатые вызовы завершаются старым исполнителем, при ошибке сборки
+    продолжает использоваться предыдущая версия алгоритма.
     """
 
     def __init__(
@@ -28,6 +63,16 @@ class AlgorithmCollection:
         function_file_name: str = DEFAULT_FUNCTION_FILE_NAME,
         test_file_name: str = DEFAULT_TEST_FILE_NAME,
         execute_timeout: int = DEFAULT_TIMEOUT,
+        execution_backend: ExecutionBackendEnum = ExecutionBackendEnum.INLINE,
+        process_pool_size: int = 0,
+        result_cache_size: int = DEFAULT_CACHE_SIZE,
+        result_cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        build_workers: int = 1,
+        build_manifest_path: str = "",
+        lazy_loading: bool = False,
+        warm_up: bool = False,
+        watch_interval: float = 0,
     ):
         """Конструктор класса
 
@@ -42,22 +87,116 @@ class AlgorithmCollection:
         :type test_file_name: str
         :param execute_timeout: таймаут выполнения алгоритма;
         :type execute_timeout: int
+        :param execution_backend: механизм выполнения методов алгоритмов;
+        :type execution_backend: ExecutionBackendEnum
+        :param process_pool_size: количество рабочих процессов для выполнения
+            алгоритмов в пуле процессов, 0 - по количеству процессоров;
+        :type process_pool_size: int
+        :param result_cache_size: максимальное количество результатов в кэше,
+            0 - кэширование отключено;
+        :type result_cache_size: int
+        :param result_cache_ttl: время жизни результата в кэше в секундах,
+            0 - без ограничения;
+        :type result_cache_ttl: float
+        :param max_batch_size: максимальное количество наборов входных данных
+            в пакетном вызове алгоритма;
+        :type max_batch_size: int
+        :param build_workers: количество процессов для выполнения тестов
+            алгоритмов при сборке, 0 - по количеству процессоров, 1 - тесты
+            выполняются последовательно в текущем процессе;
+        :type build_workers: int
+        :param build_manifest_path: путь к файлу перечня успешно
+            протестированных алгоритмов, пустая строка - тесты выполняются при
+            каждой сборке;
+        :type build_manifest_path: str
+        :param lazy_loading: откладывать сборку алгоритма до первого обращения
+            к нему;
+        :type lazy_loading: bool
+        :param warm_up: в режиме отложенной загрузки собирать алгоритмы в
+            фоновом потоке после создания набора;
+        :type warm_up: bool
+        :param watch_interval: интервал в секундах между проверками изменений
+            в каталоге алгоритмов для их повторной загрузки, 0 - каталог не
+            отслеживается.
+        :type watch_interval: float
         """
         self.__algorithms: dict[str, AlgorithmExecutor] = {}
-        builder = AlgorithmBuilder(
+        self.__definitions: dict[str, AlgorithmDefinitionSchema] = {}
+        self.__paths: dict[str, str] = {}
+        self.__build_locks: dict[str, threading.Lock] = {}
+        self.__cold_start_durations: dict[str, float] = {}
+        self.__digests: dict[str, str] = {}
+        self.__catalog_version: int = 0
+        self.__catalog_path: str = algorithms_catalog_path
+        self.__function_file_name: str = function_file_name
+        self.__lazy_loading: bool = lazy_loading
+        self.__max_batch_size: int = max_batch_size
+        self.__stop_event = threading.Event()
+        self.__reload_lock = threading.Lock()
+        alg_paths = self.__get_algorithm_paths()
+        self.__execution_backend: ExecutionBackend = self.__create_backend(
+            execution_backend,
+            process_pool_size,
+            (
+                []
+                if lazy_loading
+                else [alg_path + "/" + function_file_name for alg_path in alg_paths]
+            ),
+        )
+        self.__result_cache: ResultCache | None = (
+            ResultCache(result_cache_size, result_cache_ttl)
+            if result_cache_size > 0
+            else None
+        )
+        self.__builder = AlgorithmBuilder(
             definition_file_name,
             function_file_name,
             test_file_name,
             execute_timeout,
+            self.__execution_backend,
+            self.__result_cache,
+            build_workers,
+            build_manifest_path,
         )
-        catalog_path = algorithms_catalog_path
-        for dir in [dir for dir in os.listdir(catalog_path) if dir != "__pycache__"]:
-            alg_path = catalog_path + "/" + dir
-            if os.path.isdir(alg_path):
-                alg = builder.build_algorithm(alg_path)
-                self.__algorithms[alg.definition.name] = alg
-        if len(self.__algorithms) == 0:
-            raise RuntimeError(ErrMsg.NO_ALGORITHMS)
+        try:
+            for alg_path in alg_paths:
+                self.__digests[alg_path] = self.__builder.get_digest(alg_path)
+            if lazy_loading:
+                for alg_path in alg_paths:
+                    definition = self.__builder.load_definition(alg_path)
+                    self.__add_definition(definition, alg_path)
+            else:
+                for alg_path, alg in zip(
+                    alg_paths, self.__builder.build_algorithms(alg_paths)
+                ):
+                    self.__add_definition(alg.definition, alg_path)
+                    self.__algorithms[alg.definition.name] = alg
+            if len(self.__definitions) == 0:
+                raise RuntimeError(ErrMsg.NO_ALGORITHMS)
+        except Exception:
+            self.shutdown()
+            raise
+        if lazy_loading and warm_up:
+            threading.Thread(
+                target=self.__warm_up, name="algorithm-warm-up", daemon=True
+            ).start()
+        if watch_interval > 0:
+            threading.Thread(
+                target=self.__watch,
+                args=(watch_interval,),
+                name="algorithm-catalog-watcher",
+                daemon=True,
+            ).start()
+
+    @property
+    def catalog_version(self) -> int:
+        """Возвращает номер версии каталога, который увеличивается при каждом
+        изменении набора описаний алгоритмов.
+
+        :return: номер версии каталога.
+        :rtype: int
+        """
+        return self.__catalog_version
 
     def has_algorithm(self, algorithm_name: str) -> bool:
         """Проверяет наличие алгоритма с указанным именем.
@@ -67,6 +206,16 @@ class AlgorithmCollection:
         :return: True при наличии алгоритма, иначе False.
         :rtype: bool
         """
+        return algorithm_name in self.__definitions
+
+    def is_algorithm_loaded(self, algorithm_name: str) -> bool:
+        """Проверяет, собран ли алгоритм с указанным именем.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :return: True, если алгоритм собран и готов к выполнению, иначе False.
+        :rtype: bool
+        """
         return algorithm_name in self.__algorithms
 
     def get_algorithm_list(self) -> list[DefinitionSchema]:
@@ -75,7 +224,7 @@ class AlgorithmCollection:
         :return: список алгоритмов.
         :rtype: list[BaseEntityModel]
         """
-        return [alg.definition for alg in self.__algorithms.values()]
+        return list(self.__definitions.values())
 
     def get_algorithm_definition(
         self, algorithm_name: str
@@ -88,9 +237,9 @@ class AlgorithmCollection:
         :rtype: AlgorithmDefinitionSchema
         :raises ValueError: если алгоритм с указанным именем отсутствует;
         """
-        if algorithm_name not in self.__algorithms:
+        if algorithm_name not in self.__definitions:
             raise AlgorithmNotFoundError(algorithm_name)
-        return self.__algorithms[algorithm_name].definition
+        return self.__definitions[algorithm_name]
 
     def get_algorithm_result(
         self, algorithm_name: str, params: list[DataElementSchema]
@@ -104,9 +253,241 @@ class AlgorithmCollection:
         :return: результат выполнения алгоритма.
         :rtype: list[DataElementSchema]
         """
-        if algorithm_name not in self.__algorithms:
+        return self.__get_algorithm(algorithm_name).execute(params)
+
+    def get_algorithm_batch_result(
+        self, algorithm_name: str, params_list: list[list[DataElementSchema]]
+    ) -> list[list[DataElementSchema] | AlgorithmError]:
+        """Возвращает результаты выполнения алгоритма с указанным именем для
+        каждого набора входных данных.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param params_list: наборы значений входных данных.
+        :type params_list: list[list[DataElementSchema]]
+        :return: результаты выполнения алгоритма или ошибки в порядке наборов
+            входных данных.
+        :rtype: list[list[DataElementSchema] | AlgorithmError]
+        :raises AlgorithmValueError: если количество наборов превышает
+            допустимое.
+        """
+        return list(self.get_algorithm_batch_stream(algorithm_name, params_list))
+
+    def get_algorithm_batch_stream(
+        self, algorithm_name: str, params_list: list[list[DataElementSchema]]
+    ) -> Iterator[list[DataElementSchema] | AlgorithmError]:
+        """Запускает выполнение алгоритма с указанным именем для каждого набора
+        входных данных и возвращает итератор результатов в порядке наборов.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param params_list: наборы значений входных данных.
+        :type params_list: list[list[DataElementSchema]]
+        :return: итератор результатов выполнения алгоритма или ошибок.
+        :rtype: Iterator[list[DataElementSchema] | AlgorithmError]
+        :raises AlgorithmValueError: если количество наборов превышает
+            допустимое.
+        """
+        if algorithm_name not in self.__definitions:
             raise AlgorithmNotFoundError(algorithm_name)
-        return self.__algorithms[algorithm_name].execute(params)
+        if len(params_list) > self.__max_batch_size:
+            raise AlgorithmValueError(
+                ErrMsgTmpl.BATCH_TOO_LARGE.format(self.__max_batch_size)
+            )
+        return self.__get_algorithm(algorithm_name).execute_batch_stream(params_list)
+
+    def get_algorithm_stream(
+        self, algorithm_name: str, params: list[DataElementSchema]
+    ) -> Iterator[dict[str, Any]]:
+        """Выполняет алгоритм с указанным именем и возвращает итератор частей
+        выходных данных, формируемых по мере вычисления.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param params: значения входных данных для выполнения алгоритма.
+        :type params: list[DataElementSchema]
+        :return: итератор частей выходных данных.
+        :rtype: Iterator[dict[str, Any]]
+        """
+        return self.__get_algorithm(algorithm_name).execute_stream(params)
+
+    def get_cache_statistics(self) -> dict[str, dict[str, int]]:
+        """Возвращает количество попаданий и промахов кэша результатов по
+        алгоритмам.
+
+        :return: словарь с ключами hits и misses для каждого алгоритма.
+        :rtype: dict[str, dict[str, int]]
+        """
+        if self.__result_cache is None:
+            return {}
+        return self.__result_cache.get_statistics()
+
+    def get_cold_start_durations(self) -> dict[str, float]:
+        """Возвращает время отложенной сборки алгоритмов при первом обращении
+        к ним или при фоновом прогреве.
+
+        :return: время сборки в секундах для каждого собранного алгоритма.
+        :rtype: dict[str, float]
+        """
+        return dict(self.__cold_start_durations)
+
+    def reload(self) -> CatalogReloadSchema:
+        """Повторно загружает каталог алгоритмов. Собирает алгоритмы из новых
+        каталогов и каталогов с измененными файлами, исключает алгоритмы,
+        каталоги которых удалены. В режиме отложенной загрузки для измененных
+        алгоритмов загружается только описание.
+
+        :return: имена добавленных, обновленных и удаленных алгоритмов и
+            ошибки сборки по каталогам алгоритмов.
+        :rtype: CatalogReloadSchema
+        """
+        result = CatalogReloadSchema()
+        with self.__reload_lock:
+            alg_paths = self.__get_algorithm_paths()
+            names = {path: name for name, path in self.__paths.items()}
+            for alg_path in sorted(set(names) - set(alg_paths)):
+                self.__digests.pop(alg_path, None)
+                self.__remove_algorithm(names[alg_path])
+                result.removed.append(names[alg_path])
+            for alg_path in alg_paths:
+                digest = self.__builder.get_digest(alg_path)
+                if self.__digests.get(alg_path) == digest:
+                    continue
+                self.__digests[alg_path] = digest
+                try:
+                    name = self.__reload_algorithm(alg_path, names.get(alg_path))
+                except Exception as ex:
+                    logger.error(str(ex))
+                    result.failed[alg_path] = str(ex)
+                    continue
+                if names.get(alg_path) == name:
+                    result.updated.append(name)
+                    continue
+                if alg_path in names:
+                    result.removed.append(names[alg_path])
+                result.added.append(name)
+            if result.added or result.updated or result.removed:
+                self.__catalog_version += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Останавливает фоновый прогрев, отслеживание изменений каталога и
+        освобождает ресурсы механизма выполнения алгоритмов."""
+        self.__stop_event.set()
+        self.__execution_backend.shutdown()
+
+    def __add_definition(
+        self, definition: AlgorithmDefinitionSchema, alg_path: str
+    ) -> None:
+        """Добавляет описание алгоритма в набор."""
+        self.__definitions[definition.name] = definition
+        self.__paths[definition.name] = alg_path
+        self.__build_locks.setdefault(definition.name, threading.Lock())
+
+    def __remove_algorithm(self, algorithm_name: str) -> None:
+        """Исключает алгоритм из набора."""
+        with self.__build_locks[algorithm_name]:
+            self.__definitions.pop(algorithm_name, None)
+            self.__algorithms.pop(algorithm_name, None)
+            self.__paths.pop(algorithm_name, None)
+            self.__cold_start_durations.pop(algorithm_name, None)
+        if self.__result_cache is not None:
+            self.__result_cache.invalidate(algorithm_name)
+
+    def __reload_algorithm(self, alg_path: str, old_name: str | None) -> str:
+        """Собирает алгоритм из каталога и заменяет им предыдущую версию
+        алгоритма. Возвращает имя алгоритма."""
+        algorithm = None
+        if old_name is not None and self.__result_cache is not None:
+            self.__result_cache.invalidate(old_name)
+        if self.__lazy_loading:
+            definition = self.__builder.load_definition(alg_path)
+        else:
+            algorithm = self.__builder.build_algorithm(alg_path)
+            definition = algorithm.definition
+        name = definition.name
+        if self.__paths.get(name, alg_path) != alg_path:
+            raise AlgorithmValueError(ErrMsgTmpl.ALGORITHM_EXISTS.format(name))
+        if old_name is not None and old_name != name:
+            self.__remove_algorithm(old_name)
+
+        self.__build_locks.setdefault(name, threading.Lock())
+        with self.__build_locks[name]:
+            self.__execution_backend.invalidate(
+                alg_path + "/" + self.__function_file_name
+            )
+            if algorithm is None:
+                self.__algorithms.pop(name, None)
+            else:
+                self.__algorithms[name] = algorithm
+            self.__cold_start_durations.pop(name, None)
+            self.__add_definition(definition, alg_path)
+        if self.__result_cache is not None:
+            self.__result_cache.invalidate(name)
+        return name
+
+    def __get_algorithm_paths(self) -> list[str]:
+        """Возвращает пути к каталогам алгоритмов."""
+        catalog_path = self.__catalog_path
+        return [
+            catalog_path + "/" + dir
+            for dir in os.listdir(catalog_path)
+            if dir != "__pycache__" and os.path.isdir(catalog_path + "/" + dir)
+        ]
+
+    def __watch(self, interval: float) -> None:
+        """Периодически проверяет изменения в каталоге алгоритмов и загружает
+        их повторно."""
+        while not self.__stop_event.wait(interval):
+            try:
+                self.reload()
+            except Exception as ex:
+                logger.error(str(ex))
+
+    def __get_algorithm(self, algorithm_name: str) -> AlgorithmExecutor:
+        """Возвращает исполнителя алгоритма, собирая алгоритм при первом
+        обращении к нему."""
+        algorithm = self.__algorithms.get(algorithm_name)
+        if algorithm is not None:
+            return algorithm
+        if algorithm_name not in self.__definitions:
+            raise AlgorithmNotFoundError(algorithm_name)
+        with self.__build_locks[algorithm_name]:
+            algorithm = self.__algorithms.get(algorithm_name)
+            if algorithm is not None:
+                return algorithm
+            if algorithm_name not in self.__definitions:
+                raise AlgorithmNotFoundError(algorithm_name)
+            start = time.perf_counter()
+            try:
+                algorithm = self.__builder.build_algorithm(self.__paths[algorithm_name])
+            except Exception as ex:
+                logger.error(str(ex))
+                raise AlgorithmRuntimeError(str(ex))
+            self.__cold_start_durations[algorithm_name] = time.perf_counter() - start
+            self.__algorithms[algorithm_name] = algorithm
+        return algorithm
+
+    def __warm_up(self) -> None:
+        """Собирает в фоновом режиме алгоритмы, к которым еще не обращались."""
+        for algorithm_name in list(self.__definitions):
+            if self.__stop_event.is_set():
+                return
+            try:
+                self.__get_algorithm(algorithm_name)
+            except AlgorithmError:
+                pass
+
+    @staticmethod
+    def __create_backend(
+        execution_backend: ExecutionBackendEnum,
+        process_pool_size: int,
+        function_paths: list[str],
+    ) -> ExecutionBackend:
+        """Создает механизм выполнения методов алгоритмов."""
+        if execution_backend == ExecutionBackendEnum.PROCESS:
+            return ProcessPoolExecutionBackend(process_pool_size, function_paths)
+        return InlineExecutionBackend()
 
 
 if __name__ == "__main__":
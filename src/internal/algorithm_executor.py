@@ -1,19 +1,25 @@
-import logging
-import signal
+from collections.abc import Iterator
 from typing import Any, Callable
 
 from pydantic import ValidationError
 
 from src.internal.constants import DEFAULT_TIMEOUT
-from src.internal.data_dimension.data_dimension_checker import DataDimensionChecker
-from src.internal.errors import (
-    AlgorithmError,
-    AlgorithmTimeoutError,
-    AlgorithmUnexpectedError,
+from src.internal.data_dimension.data_array_converter import DataArrayConverter
+from src.internal.data_dimension.data_dimension_checker import (
+    DataDimensionChecker,
+    ItemChecker,
+    ValueChecker,
 )
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
-from src.internal.errors.exceptions import AlgorithmTypeError, AlgorithmValueError
+from src.internal.errors.exceptions import (
+    AlgorithmError,
+    AlgorithmTypeError,
+    AlgorithmValueError,
+)
+from src.internal.execution import ExecutionBackend, InlineExecutionBackend
+from src.internal.result_cache import ResultCache
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_definition_schema import DataDefinitionSchema
 from src.internal.schemas.data_element_schema import (
@@ -22,8 +28,6 @@ from src.internal.schemas.data_element_schema import (
 )
 from src.internal.schemas.output_definition_schema import OutputDefinitionSchema
 
-logger = logging.getLogger(__name__)
-
 
 class AlgorithmExecutor(object):
     """Класс содержит описание алгоритма, структуры его входных и
@@ -36,6 +40,8 @@ class AlgorithmExecutor(object):
         definition: AlgorithmDefinitionSchema,
         method: Callable,
         execute_timeout: int = DEFAULT_TIMEOUT,
+        execution_backend: ExecutionBackend | None = None,
+        result_cache: ResultCache | None = None,
     ):
         """Конструктор класса
 
@@ -45,12 +51,45 @@ class AlgorithmExecutor(object):
         :type method: Callable
         :param execute_timeout: время отведенное для выполнения алгоритма;
         :type execute_timeout: int
+        :param execution_backend: механизм выполнения метода алгоритма, по
+            умолчанию метод выполняется в вызывающем потоке;
+        :type execution_backend: ExecutionBackend or None
+        :param result_cache: кэш результатов, используется только если все
+            выходные данные алгоритма детерминированы;
+        :type result_cache: ResultCache or None
         :raises ValueError: при несоответствии типов данных для параметров,
             при отрицательных значениях параметра execute_timeout.
         """
         self.__definition: AlgorithmDefinitionSchema = definition
         self.__execute_timeout: int = execute_timeout
         self.__execute_method: Callable = method
+        self.__execution_backend: ExecutionBackend = (
+            execution_backend or InlineExecutionBackend()
+        )
+        self.__result_cache: ResultCache | None = (
+            result_cache
+            if all(output.is_deterministic for output in definition.outputs)
+            else None
+        )
+        self.__parameters: dict[str, DataDefinitionSchema] = {
+            param.name: param for param in definition.parameters
+        }
+        self.__outputs: dict[str, OutputDefinitionSchema] = {
+            output.name: output for output in definition.outputs
+        }
+        self.__parameter_checkers: dict[str, ValueChecker] = {
+            name: DataDimensionChecker.compile(param)
+            for name, param in self.__parameters.items()
+        }
+        self.__output_checkers: dict[str, ValueChecker] = {
+            name: DataDimensionChecker.compile(output)
+            for name, output in self.__outputs.items()
+        }
+        self.__output_item_checkers: dict[str, ItemChecker] = {
+            name: DataDimensionChecker.compile_item(output)
+            for name, output in self.__outputs.items()
+            if output.data_shape != DataShapeEnum.SCALAR
+        }
         self.__validate()
 
     def __str__(self) -> str:
@@ -78,24 +117,24 @@ class AlgorithmExecutor(object):
     @property
     def parameter_names(self):
         """Возвращает названия для входных данных алгоритма."""
-        return [param.name for param in self.definition.parameters]
+        return list(self.__parameters)
 
     @property
     def output_names(self):
         """Возвращает названия для выходных данных алгоритма."""
-        return [output.name for output in self.definition.outputs]
+        return list(self.__outputs)
 
     def get_parameter_by_name(self, name):
         """Возвращает описание элемента входных данных по его имени."""
-        if name not in self.parameter_names:
+        if name not in self.__parameters:
             raise AlgorithmValueError(ErrMsgTmpl.REDUNDANT_PARAMETER.format(name))
-        return [param for param in self.definition.parameters if param.name == name][0]
+        return self.__parameters[name]
 
     def get_output_by_name(self, name):
         """Возвращает описание элемента выходных данных по его имени."""
-        if name not in self.output_names:
+        if name not in self.__outputs:
             raise AlgorithmValueError(ErrMsgTmpl.REDUNDANT_OUTPUT.format(name))
-        return [output for output in self.definition.outputs if output.name == name][0]
+        return self.__outputs[name]
 
     def execute(self, params: DataElementsSchema) -> DataElementsSchema:
         """Выполняет алгоритм с заданными входными данными.
@@ -105,74 +144,247 @@ class AlgorithmExecutor(object):
         :return: результаты выполнения алгоритма.
         :rtype: DataElementsSchema
         """
+        params_dict = self.__get_input_values(params)
+        output_dict = self.__get_cached_result(params_dict)
+        if output_dict is None:
+            output_dict = self.__execute(self.__convert_input_values(params_dict))
+            output_dict = self.__complete_output_values(params_dict, output_dict)
+        return self.__get_output_elements(output_dict)
+
+    def execute_stream(self, params: DataElementsSchema) -> Iterator[dict[str, Any]]:
+        """Выполняет алгоритм с заданными входными данными и возвращает
+        выходные данные по частям: скалярное значение в виде словаря с ключами
+        name и value, каждый элемент списка или строку матрицы в виде словаря
+        с ключами name и item.
+
+        Значения, возвращенные методом алгоритма в виде итераторов, проверяются
+        и передаются поэлементно по мере вычисления, не размещаясь в памяти
+        целиком. Ошибки проверки входных данных и вызова метода возникают при
+        вызове данного метода, ошибки вычисления и проверки элементов - при
+        получении очередной части выходных данных.
+
+        :param params: значения входных данных для выполнения алгоритма.
+        :type params: DataElementsSchema
+        :return: итератор частей выходных данных.
+        :rtype: Iterator[dict[str, Any]]
+        """
+        params_dict = self.__get_input_values(params)
+        output_dict = self.__get_cached_result(params_dict)
+        if output_dict is None:
+            output_dict = self.__execution_backend.execute_stream(
+                self.__execute_method,
+                self.__convert_input_values(params_dict),
+                self.__execute_timeout,
+            )
+            if not isinstance(output_dict, dict) or not any(
+                isinstance(value, Iterator) for value in output_dict.values()
+            ):
+                output_dict = self.__complete_output_values(params_dict, output_dict)
+            else:
+                lazy_names = {
+                    name
+                    for name, value in output_dict.items()
+                    if isinstance(value, Iterator)
+                }
+                self.__validate_output_values(output_dict, lazy_names)
+                output_dict = {
+                    name: (
+                        value
+                        if name in lazy_names
+                        else DataArrayConverter.to_list(value)
+                    )
+                    for name, value in output_dict.items()
+                }
+        return self.__iterate_output_parts(output_dict)
+
+    def execute_batch(
+        self, params_list: list[DataElementsSchema]
+    ) -> list[DataElementsSchema | AlgorithmError]:
+        """Выполняет алгоритм для каждого набора входных данных. Наборы, не
+        прошедшие проверку или завершившиеся ошибкой, не прерывают выполнение
+        остальных наборов.
+
+        :param params_list: наборы значений входных данных.
+        :type params_list: list[DataElementsSchema]
+        :return: результаты выполнения алгоритма или ошибки в порядке наборов
+            входных данных.
+        :rtype: list[DataElementsSchema | AlgorithmError]
+        """
+        return list(self.execute_batch_stream(params_list))
+
+    def execute_batch_stream(
+        self, params_list: list[DataElementsSchema]
+    ) -> Iterator[DataElementsSchema | AlgorithmError]:
+        """Проверяет наборы входных данных и запускает выполнение алгоритма для
+        каждого из них. Результаты возвращаются в порядке наборов по мере
+        завершения выполнения.
+
+        :param params_list: наборы значений входных данных.
+        :type params_list: list[DataElementsSchema]
+        :return: итератор результатов выполнения алгоритма или ошибок.
+        :rtype: Iterator[DataElementsSchema | AlgorithmError]
+        """
+        results: dict[int, DataElementsSchema | AlgorithmError] = {}
+        pending: dict[int, dict[str, Any]] = {}
+        for idx, params in enumerate(params_list):
+            try:
+                params_dict = self.__get_input_values(params)
+            except AlgorithmError as ex:
+                results[idx] = ex
+                continue
+            output_dict = self.__get_cached_result(params_dict)
+            if output_dict is None:
+                pending[idx] = params_dict
+            else:
+                results[idx] = self.__get_output_elements(output_dict)
+
+        outputs = self.__execution_backend.execute_many(
+            self.__execute_method,
+            [self.__convert_input_values(params) for params in pending.values()],
+            self.__execute_timeout,
+        )
+        return self.__iterate_batch_results(
+            len(params_list), results, zip(pending.values(), outputs)
+        )
+
+    def __iterate_batch_results(
+        self,
+        count: int,
+        results: dict[int, DataElementsSchema | AlgorithmError],
+        outputs: Iterator[tuple[dict[str, Any], dict[str, Any] | AlgorithmError]],
+    ) -> Iterator[DataElementsSchema | AlgorithmError]:
+        """Возвращает результаты пакетного выполнения в порядке наборов
+        входных данных."""
+        for idx in range(count):
+            if idx in results:
+                yield results.pop(idx)
+                continue
+            params_dict, output_dict = next(outputs)
+            try:
+                if isinstance(output_dict, AlgorithmError):
+                    raise output_dict
+                output_dict = self.__complete_output_values(params_dict, output_dict)
+                result = self.__get_output_elements(output_dict)
+            except AlgorithmError as ex:
+                result = ex
+            yield result
+
+    def __iterate_output_parts(
+        self, outputs: dict[str, Any]
+    ) -> Iterator[dict[str, Any]]:
+        """Возвращает выходные данные по частям, проверяя элементы значений,
+        вычисляемых постепенно."""
+        for name, value in outputs.items():
+            if name not in self.__output_item_checkers:
+                yield {"name": name, "value": value}
+                continue
+            if not isinstance(value, Iterator):
+                for item in value:
+                    yield {"name": name, "item": item}
+                continue
+            check_item = self.__output_item_checkers[name]
+            count = 0
+            for idx, item in enumerate(value):
+                errors = check_item(idx, item)
+                if errors is not None:
+                    raise AlgorithmTypeError(errors)
+                yield {"name": name, "item": DataArrayConverter.to_list(item)}
+                count += 1
+            if count == 0 and self.__outputs[name].data_shape == DataShapeEnum.MATRIX:
+                raise AlgorithmTypeError(ErrMsg.NOT_MATRIX_VALUE)
+
+    def __get_input_values(self, params: DataElementsSchema) -> dict[str, Any]:
+        """Проверяет входные данные и возвращает их в виде словаря."""
         try:
             DataElementsSchema.model_validate(params)
         except ValidationError:
             raise AlgorithmTypeError(ErrMsg.INCORRECT_PARAMS)
         params_dict = {param.name: param.value for param in params}
         self.validate_input_values(params_dict)
-
-        output_dict = self.__execute(params_dict)
-
-        self.__validate_output_values(output_dict)
+        return params_dict
+
+    def __complete_output_values(
+        self, params: dict[str, Any], outputs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Проверяет выходные данные, преобразует массивы в списки и сохраняет
+        результат в кэше."""
+        self.__validate_output_values(outputs)
+        outputs = {
+            name: DataArrayConverter.to_list(value) for name, value in outputs.items()
+        }
+        if self.__result_cache is not None:
+            self.__result_cache.put(self.definition.name, params, outputs)
+        return outputs
+
+    @staticmethod
+    def __get_output_elements(outputs: dict[str, Any]) -> DataElementsSchema:
+        """Возвращает выходные данные в виде списка элементов данных. Значения
+        уже проверены по описанию алгоритма, поэтому элементы создаются без
+        повторной проверки."""
         return [
-            DataElementSchema(name=name, value=value)
-            for name, value in output_dict.items()
+            DataElementSchema.model_construct(name=name, value=value)
+            for name, value in outputs.items()
         ]
 
-    def __execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        """Выполняет алгоритм с заданными входными данными. Устанавливает
-        предельное время выполнения алгоритма."""
-        if self.__execute_timeout > 0:
-            signal.signal(signal.SIGALRM, self.__get_timeout_handler())
-            signal.alarm(self.__execute_timeout)
+    def __get_cached_result(self, params: dict[str, Any]) -> dict[str, Any] | None:
+        """Возвращает сохраненный в кэше результат выполнения алгоритма."""
+        if self.__result_cache is None:
+            return None
+        return self.__result_cache.get(self.definition.name, params)
+
+    def __convert_input_values(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Преобразует проверенные входные данные к виду, ожидаемому методом
+        алгоритма: данные с флагом as_array передаются в виде массивов NumPy,
+        остальные массивы преобразуются в списки."""
+        return {
+            name: (
+                DataArrayConverter.to_array(self.__parameters[name], value)
+                if self.__parameters[name].as_array
+                else DataArrayConverter.to_list(value)
+            )
+            for name, value in params.items()
+        }
 
-        try:
-            return self.__execute_method(**params)
-        except AlgorithmError:
-            raise
-        except TypeError as ex:
-            if "unexpected keyword argument" in str(ex):
-                raise AlgorithmTypeError(ErrMsg.UNEXPECTED_PARAM)
-            raise
-        except Exception as ex:
-            logger.error(str(ex))
-            raise AlgorithmUnexpectedError()
-        finally:
-            if self.__execute_timeout > 0:
-                signal.alarm(0)
+    def __execute(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Выполняет алгоритм с заданными входными данными с помощью механизма
+        выполнения. Устанавливает предельное время выполнения алгоритма."""
+        return self.__execution_backend.execute(
+            self.__execute_method, params, self.__execute_timeout
+        )
 
     def validate_input_values(self, fact_params: dict[str, Any]) -> None:
         """ "Проверяет входные данные для выполнения алгоритма. При наличии
         ошибок вызывает исключения AlgorithmTypeError, AlgorithmValueError."""
         if not isinstance(fact_params, dict):
             raise AlgorithmTypeError(ErrMsg.INCORRECT_PARAMS)
-        for key in fact_params.keys():
-            if key not in self.parameter_names:
+        for key in fact_params:
+            if key not in self.__parameter_checkers:
                 raise AlgorithmValueError(ErrMsgTmpl.REDUNDANT_PARAMETER.format(key))
-        for key in self.parameter_names:
-            if key not in fact_params.keys():
+        for key, check_value in self.__parameter_checkers.items():
+            if key not in fact_params:
                 raise AlgorithmValueError(ErrMsgTmpl.MISSED_PARAMETER.format(key))
-            errors = DataDimensionChecker.check_value(
-                self.get_parameter_by_name(key), fact_params[key]
-            )
+            errors = check_value(fact_params[key])
             if errors is not None:
                 raise AlgorithmTypeError(errors)
 
-    def __validate_output_values(self, method_outputs: dict[str, Any]) -> None:
+    def __validate_output_values(
+        self, method_outputs: dict[str, Any], lazy_names: set[str] | None = None
+    ) -> None:
         """ "Проверяет выходные данные для выполнения алгоритма. При наличии
-        ошибок вызывает исключения AlgorithmTypeError, AlgorithmValueError."""
+        ошибок вызывает исключения AlgorithmTypeError, AlgorithmValueError.
+        Значения с именами из lazy_names вычисляются постепенно и проверяются
+        поэлементно при их получении."""
         if not isinstance(method_outputs, dict):
             raise AlgorithmTypeError(ErrMsg.NOT_DICT_OUTPUTS)
-        for key in method_outputs.keys():
-            if key not in self.output_names:
+        for key in method_outputs:
+            if key not in self.__output_checkers:
                 raise AlgorithmValueError(ErrMsgTmpl.REDUNDANT_OUTPUT.format(key))
-        for key in self.output_names:
-            if key not in method_outputs.keys():
+        for key, check_value in self.__output_checkers.items():
+            if key not in method_outputs:
                 raise AlgorithmValueError(ErrMsgTmpl.MISSED_OUTPUT.format(key))
-            errors = DataDimensionChecker.check_value(
-                self.get_output_by_name(key), method_outputs[key]
-            )
+            if lazy_names and key in lazy_names:
+                continue
+            errors = check_value(method_outputs[key])
             if errors is not None:
                 raise AlgorithmTypeError(errors)
 
@@ -221,12 +433,6 @@ class AlgorithmExecutor(object):
         if errors is not None:
             raise RuntimeError(ErrMsgTmpl.ADDING_METHOD_FAILED.format(errors))
 
-    def __get_timeout_handler(self):
-        def timeout_handler(signum, frame):
-            raise AlgorithmTimeoutError(self.__execute_timeout)
-
-        return timeout_handler
-
 
 if __name__ == "__main__":
     algorithm_definition = AlgorithmDefinitionSchema(
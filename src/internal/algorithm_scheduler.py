@@ -0,0 +1,82 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from src.internal.errors.exceptions import AlgorithmOverloadedError
+
+
+class AlgorithmScheduler:
+    """Класс выполняет вызовы алгоритмов в пуле потоков, не блокируя цикл
+    событий приложения. Количество принятых и еще не завершенных вызовов
+    ограничено суммой количества потоков и размера очереди, при превышении
+    ограничения вызов отклоняется.
+    """
+
+    def __init__(self, max_workers: int = 0, max_queue_size: int = 0):
+        """Конструктор класса
+
+        :param max_workers: количество потоков для выполнения алгоритмов,
+            0 - по количеству процессоров;
+        :type max_workers: int
+        :param max_queue_size: количество вызовов, ожидающих свободный поток;
+        :type max_queue_size: int
+        """
+        self.__max_workers: int = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.__capacity: int = self.__max_workers + max_queue_size
+        self.__pending: int = 0
+        self.__lock = threading.Lock()
+        self.__executor = ThreadPoolExecutor(
+            self.__max_workers, thread_name_prefix="algorithm"
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Возвращает количество потоков для выполнения алгоритмов.
+
+        :return: количество потоков.
+        :rtype: int
+        """
+        return self.__max_workers
+
+    @property
+    def pending(self) -> int:
+        """Возвращает количество принятых и еще не завершенных вызовов.
+
+        :return: количество вызовов.
+        :rtype: int
+        """
+        return self.__pending
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """Выполняет функцию в пуле потоков и ожидает результат.
+
+        :param func: функция для выполнения;
+        :type func: Callable
+        :param args: аргументы функции;
+        :return: результат выполнения функции.
+        :rtype: Any
+        :raises AlgorithmOverloadedError: при превышении количества вызовов.
+        """
+        with self.__lock:
+            if self.__pending >= self.__capacity:
+                raise AlgorithmOverloadedError()
+            self.__pending += 1
+        try:
+            future = self.__executor.submit(partial(func, *args))
+        except BaseException:
+            self.__release()
+            raise
+        future.add_done_callback(self.__release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Завершает работу пула потоков."""
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __release(self, future: Future | None = None) -> None:
+        """Освобождает место для нового вызова."""
+        with self.__lock:
+            self.__pending -= 1
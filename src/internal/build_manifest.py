@@ -0,0 +1,101 @@
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class BuildManifest:
+    """Класс представляет хранимый на диске перечень алгоритмов, тесты которых
+    завершились успешно. Для каждого каталога алгоритма сохраняется хэш
+    содержимого файлов, по которым собирается алгоритм. Если содержимое файлов
+    не изменилось, повторный запуск тестов при сборке не требуется.
+    """
+
+    def __init__(self, path: str):
+        """Конструктор класса
+
+        :param path: путь к файлу перечня, пустая строка - перечень не
+            сохраняется на диске;
+        :type path: str
+        """
+        self.__path: str = path
+        self.__entries: dict[str, str] = self.__load()
+
+    def is_passed(self, algorithm_path: str, digest: str) -> bool:
+        """Проверяет, завершились ли успешно тесты алгоритма с тем же
+        содержимым файлов.
+
+        :param algorithm_path: путь к каталогу алгоритма;
+        :type algorithm_path: str
+        :param digest: хэш содержимого файлов алгоритма;
+        :type digest: str
+        :return: True, если тесты уже завершались успешно, иначе False.
+        :rtype: bool
+        """
+        return self.__entries.get(os.path.abspath(algorithm_path)) == digest
+
+    def set_passed(self, algorithm_path: str, digest: str) -> None:
+        """Сохраняет хэш содержимого файлов алгоритма, тесты которого
+        завершились успешно.
+
+        :param algorithm_path: путь к каталогу алгоритма;
+        :type algorithm_path: str
+        :param digest: хэш содержимого файлов алгоритма.
+        :type digest: str
+        """
+        self.__entries[os.path.abspath(algorithm_path)] = digest
+
+    def save(self) -> None:
+        """Записывает перечень на диск. Запись выполняется через временный файл,
+        поэтому прерванная запись не повреждает сохраненный ранее перечень."""
+        if not self.__path:
+            return
+        tmp_path = self.__path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self.__entries, file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.__path)
+        except OSError as ex:
+            logger.error(str(ex))
+
+    @staticmethod
+    def get_digest(file_paths: list[str]) -> str:
+        """Возвращает хэш содержимого файлов.
+
+        :param file_paths: пути к файлам;
+        :type file_paths: list[str]
+        :return: хэш SHA-256 в шестнадцатеричном виде, отсутствующий файл
+            учитывается как отдельное состояние, отличное от пустого файла.
+        :rtype: str
+        """
+        digest = hashlib.sha256()
+        for file_path in file_paths:
+            if not os.path.isfile(file_path):
+                digest.update(b"\xff" * 8)
+                continue
+            with open(file_path, "rb") as file:
+                content = file.read()
+            digest.update(len(content).to_bytes(8, "big"))
+            digest.update(content)
+        return digest.hexdigest()
+
+    def __load(self) -> dict[str, str]:
+        """Загружает перечень с диска. Отсутствующий или поврежденный файл
+        соответствует пустому перечню."""
+        if not self.__path or not os.path.isfile(self.__path):
+            return {}
+        try:
+            with open(self.__path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError) as ex:
+            logger.error(str(ex))
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        return {
+            key: value
+            for key, value in entries.items()
+            if isinstance(key, str) and isinstance(value, str)
+        }
@@ -2,6 +2,12 @@
 
 DEFAULT_TIMEOUT = 5
 """Время на выполнение алгоритма, заданное по умолчанию."""
+DEFAULT_CACHE_SIZE = 1024
+"""Максимальное количество результатов в кэше по умолчанию."""
+DEFAULT_CACHE_TTL = 3600
+"""Время жизни результата в кэше по умолчанию, в секундах."""
+DEFAULT_MAX_BATCH_SIZE = 1000
+"""Максимальное количество наборов входных данных в пакетном вызове по умолчанию."""
 DEFAULT_DEFINITION_FILE_NAME = "definition.json"
 """Имя файла с описанием алгоритма по умолчанию."""
 DEFAULT_FUNCTION_FILE_NAME = "function.py"
@@ -12,3 +18,5 @@ DEFAULT_ALGORITHMS_CATALOG_PATH = "src/algorithms"
 """Имя каталога с алгоритмами по умолчанию."""
 ALGORITHMS_ENDPOINT = "/api/algorithms"
 """Конечная точка для API"""
+ADMIN_ENDPOINT = "/api/admin"
+"""Конечная точка для администрирования приложения"""
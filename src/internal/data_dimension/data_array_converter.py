@@ -0,0 +1,57 @@
+from typing import Any
+
+import numpy as np
+
+from src.internal.data_dimension.data_dimension import DataDimension
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+
+_EMPTY_DTYPES: dict[DataTypeEnum, type] = {
+    DataTypeEnum.INT: np.int64,
+    DataTypeEnum.FLOAT: np.float64,
+    DataTypeEnum.STRING: np.str_,
+    DataTypeEnum.BOOL: np.bool_,
+}
+"""Типы данных NumPy для пустых массивов."""
+
+
+class DataArrayConverter:
+    """Класс реализует преобразование проверенных списков и матриц в массивы
+    NumPy и обратное преобразование массивов в списки."""
+
+    @classmethod
+    def to_array(cls, data_dimension: DataDimension, value: Any) -> Any:
+        """Преобразует список или матрицу в массив NumPy. Значение возвращается
+        без изменений, если матрица не прямоугольная или элементы значения не
+        могут быть представлены массивом с типом данных элемента данных,
+        например содержат None или целые числа, превышающие 64 бита.
+
+        :param data_dimension: описание элемента данных;
+        :param value: проверенное значение;
+        :type value: Any
+        :return: массив NumPy или исходное значение.
+        :rtype: Any
+        """
+        if isinstance(value, np.ndarray):
+            return value
+        try:
+            array = np.array(value)
+        except (ValueError, OverflowError):
+            return value
+        if array.size == 0:
+            return array.astype(_EMPTY_DTYPES[data_dimension.data_type])
+        if array.dtype.kind not in data_dimension.data_type.array_kinds:
+            return value
+        return array
+
+    @classmethod
+    def to_list(cls, value: Any) -> Any:
+        """Преобразует массив NumPy в список значений стандартных типов Python.
+
+        :param value: значение для преобразования;
+        :type value: Any
+        :return: список или исходное значение, если оно не является массивом.
+        :rtype: Any
+        """
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        return value
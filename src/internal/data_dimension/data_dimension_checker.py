@@ -1,10 +1,25 @@
-from typing import Any
+from itertools import chain
+from typing import Any, Callable
+
+import numpy as np
 
 from src.internal.data_dimension.data_dimension import DataDimension
-from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_shape_enum import SCALAR_TYPES, DataShapeEnum
 from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 
+ValueChecker = Callable[[Any], str | None]
+ItemChecker = Callable[[int, Any], str | None]
+
+_ITEM_TYPES: dict[DataTypeEnum, frozenset[type]] = {
+    DataTypeEnum.INT: frozenset([int, type(None)]),
+    DataTypeEnum.FLOAT: frozenset([int, float, type(None)]),
+    DataTypeEnum.STRING: frozenset([str, type(None)]),
+    DataTypeEnum.BOOL: frozenset([bool, type(None)]),
+}
+"""Типы элементов списков и матриц, проверяемые без обхода значений в цикле."""
+
 
 class DataDimensionChecker:
     """Класс реализует проверку значений на соответствие типу и размерности данных."""
@@ -31,6 +46,162 @@ class DataDimensionChecker:
             return cls.__check_matrix_value(data_dimension, value)
         return None
 
+    @classmethod
+    def compile(cls, data_dimension: DataDimension) -> ValueChecker:
+        """Создает функцию проверки значений на соответствие типу данных
+        и размерности элемента данных. Тип данных и размерность разрешаются
+        один раз при создании функции, а не при каждой проверке значения.
+
+        Для списков и матриц типы всех элементов сначала проверяются одним
+        проходом, поэлементная проверка выполняется только для формирования
+        сообщения об ошибке с индексами элемента. Функция также принимает
+        массивы NumPy соответствующей размерности, тип элементов которых
+        проверяется по типу данных массива.
+
+        :param data_dimension: описание элемента данных;
+        :return: функция, которая принимает проверяемое значение и возвращает
+            текст сообщения об ошибке проверки типа и размерности или None.
+        :rtype: Callable[[Any], str | None]
+        """
+        is_valid = cls.__get_type_predicate(data_dimension.data_type)
+        if data_dimension.data_shape == DataShapeEnum.SCALAR:
+            return cls.__compile_scalar_checker(data_dimension.data_type, is_valid)
+        if data_dimension.data_shape == DataShapeEnum.LIST:
+            return cls.__compile_list_checker(data_dimension.data_type, is_valid)
+        return cls.__compile_matrix_checker(data_dimension.data_type, is_valid)
+
+    @classmethod
+    def compile_item(cls, data_dimension: DataDimension) -> ItemChecker:
+        """Создает функцию проверки отдельного элемента списка или строки
+        матрицы. Используется для проверки значений, которые формируются
+        алгоритмом постепенно и не могут быть проверены целиком.
+
+        :param data_dimension: описание элемента данных списка или матрицы;
+        :return: функция, которая принимает индекс и значение элемента списка
+            (строки матрицы) и возвращает текст сообщения об ошибке или None.
+        :rtype: Callable[[int, Any], str | None]
+        :raises ValueError: для скалярного элемента данных.
+        """
+        data_type = data_dimension.data_type
+        is_valid = cls.__get_type_predicate(data_type)
+        if data_dimension.data_shape == DataShapeEnum.LIST:
+
+            def check_item(idx: int, item: Any) -> str | None:
+                if item is not None and not is_valid(item):
+                    return ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(idx, data_type)
+                return None
+
+            return check_item
+        if data_dimension.data_shape == DataShapeEnum.MATRIX:
+            item_types = _ITEM_TYPES[data_type]
+
+            def check_row(row_idx: int, row: Any) -> str | None:
+                if isinstance(row, np.ndarray) and row.ndim == 1:
+                    row = row.tolist()
+                if not isinstance(row, list):
+                    return ErrMsgTmpl.NOT_LIST_ROW.format(row_idx)
+                if item_types.issuperset(map(type, row)):
+                    return None
+                for item_idx, item in enumerate(row):
+                    if item is not None and not is_valid(item):
+                        return ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(
+                            item_idx, row_idx, data_type
+                        )
+                return None
+
+            return check_row
+        raise ValueError(ErrMsg.NOT_LIST_VALUE)
+
+    @staticmethod
+    def __get_type_predicate(data_type: DataTypeEnum) -> Callable[[Any], bool]:
+        """Возвращает функцию проверки типа данных для скалярного значения."""
+        if data_type == DataTypeEnum.FLOAT:
+            return lambda item: isinstance(item, (int, float)) and not isinstance(
+                item, bool
+            )
+        if data_type == DataTypeEnum.INT:
+            return lambda item: isinstance(item, int) and not isinstance(item, bool)
+        python_type = data_type.type
+        return lambda item: isinstance(item, python_type)
+
+    @staticmethod
+    def __compile_scalar_checker(
+        data_type: DataTypeEnum, is_valid: Callable[[Any], bool]
+    ) -> ValueChecker:
+        """Создает функцию проверки скалярного значения."""
+        err_msg = ErrMsgTmpl.MISMATCH_VALUE_TYPE.format(data_type)
+
+        def check_scalar(value: Any) -> str | None:
+            if value is None:
+                return ErrMsg.NONE_VALUE
+            if not isinstance(value, SCALAR_TYPES):
+                return ErrMsg.NOT_SCALAR_VALUE
+            if not is_valid(value):
+                return err_msg
+            return None
+
+        return check_scalar
+
+    @staticmethod
+    def __compile_list_checker(
+        data_type: DataTypeEnum, is_valid: Callable[[Any], bool]
+    ) -> ValueChecker:
+        """Создает функцию проверки списка значений."""
+        item_types = _ITEM_TYPES[data_type]
+
+        def check_list(value: Any) -> str | None:
+            if value is None:
+                return ErrMsg.NONE_VALUE
+            if isinstance(value, np.ndarray):
+                if value.ndim != 1:
+                    return ErrMsg.NOT_LIST_VALUE
+                if value.dtype.kind in data_type.array_kinds:
+                    return None
+                value = value.tolist()
+            if not isinstance(value, list):
+                return ErrMsg.NOT_LIST_VALUE
+            if item_types.issuperset(map(type, value)):
+                return None
+            for idx, item in enumerate(value):
+                if item is not None and not is_valid(item):
+                    return ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(idx, data_type)
+            return None
+
+        return check_list
+
+    @staticmethod
+    def __compile_matrix_checker(
+        data_type: DataTypeEnum, is_valid: Callable[[Any], bool]
+    ) -> ValueChecker:
+        """Создает функцию проверки матрицы значений."""
+        item_types = _ITEM_TYPES[data_type]
+
+        def check_matrix(value: Any) -> str | None:
+            if value is None:
+                return ErrMsg.NONE_VALUE
+            if isinstance(value, np.ndarray):
+                if value.ndim != 2 or len(value) == 0:
+                    return ErrMsg.NOT_MATRIX_VALUE
+                if value.dtype.kind in data_type.array_kinds:
+                    return None
+                value = value.tolist()
+            if not isinstance(value, list) or len(value) == 0:
+                return ErrMsg.NOT_MATRIX_VALUE
+            for row_idx, row in enumerate(value):
+                if not isinstance(row, list):
+                    return ErrMsgTmpl.NOT_LIST_ROW.format(row_idx)
+            if item_types.issuperset(map(type, chain.from_iterable(value))):
+                return None
+            for row_idx, row in enumerate(value):
+                for item_idx, item in enumerate(row):
+                    if item is not None and not is_valid(item):
+                        return ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(
+                            item_idx, row_idx, data_type
+                        )
+            return None
+
+        return check_matrix
+
     @classmethod
     def __check_scalar_value(
         cls, data_dimension: DataDimension, value: Any
@@ -7,6 +7,9 @@ from src.internal.data_dimension.data_type_enum import DataTypeEnum
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 
+SCALAR_TYPES = tuple(DataTypeEnum.types())
+"""Типы данных скалярных значений."""
+
 
 class DataShapeEnum(UppercaseStrEnum):
     """Перечисление допустимых размерностей для входных и выходных данных алгоритмов.
@@ -29,9 +32,7 @@ class DataShapeEnum(UppercaseStrEnum):
         """
         if value_to_check is None:
             return ErrMsg.NONE_VALUE
-        if self.value == self.SCALAR and not isinstance(
-            value_to_check, tuple(DataTypeEnum.types())
-        ):
+        if self.value == self.SCALAR and not isinstance(value_to_check, SCALAR_TYPES):
             return ErrMsg.NOT_SCALAR_VALUE
         if self.value == self.LIST and not isinstance(value_to_check, list):
             return ErrMsg.NOT_LIST_VALUE
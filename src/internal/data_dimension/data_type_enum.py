@@ -22,7 +22,17 @@ class DataTypeEnum(UppercaseStrEnum):
         :return: тип данных.
         :rtype: type
         """
-        return DataTypeEnum.__types_dict()[self]
+        return _DATA_TYPES[self]
+
+    @property
+    def array_kinds(self) -> str:
+        """Возвращает коды видов типов данных NumPy (dtype.kind), допустимых
+        для элементов массива.
+
+        :return: строка с кодами видов типов данных.
+        :rtype: str
+        """
+        return _ARRAY_KINDS[self]
 
     @staticmethod
     def types() -> list[type]:
@@ -31,18 +41,24 @@ class DataTypeEnum(UppercaseStrEnum):
         :return: список допустимых типов данных.
         :rtype: list[type]
         """
-        return list(DataTypeEnum.__types_dict().values())
+        return list(_DATA_TYPES.values())
 
     def __str__(self) -> str:
         """Возвращает строковое представление экземпляра класса."""
         return self.name.lower()
 
-    @staticmethod
-    def __types_dict():
-        """Возвращает словарь соответствия типам данных."""
-        return {
-            DataTypeEnum.INT: int,
-            DataTypeEnum.FLOAT: float,
-            DataTypeEnum.STRING: str,
-            DataTypeEnum.BOOL: bool,
-        }
+
+_DATA_TYPES: dict[DataTypeEnum, type] = {
+    DataTypeEnum.INT: int,
+    DataTypeEnum.FLOAT: float,
+    DataTypeEnum.STRING: str,
+    DataTypeEnum.BOOL: bool,
+}
+"""Словарь соответствия типам данных."""
+_ARRAY_KINDS: dict[DataTypeEnum, str] = {
+    DataTypeEnum.INT: "iu",
+    DataTypeEnum.FLOAT: "iuf",
+    DataTypeEnum.STRING: "U",
+    DataTypeEnum.BOOL: "b",
+}
+"""Словарь соответствия видам типов данных NumPy."""
@@ -5,6 +5,7 @@ from .error_message_template_enum import ErrorMessageTemplateEnum
 from .exceptions import (
     AlgorithmError,
     AlgorithmNotFoundError,
+    AlgorithmOverloadedError,
     AlgorithmRuntimeError,
     AlgorithmTimeoutError,
     AlgorithmTypeError,
@@ -21,5 +22,6 @@ __all__ = [
     "AlgorithmTimeoutError",
     "AlgorithmRuntimeError",
     "AlgorithmNotFoundError",
+    "AlgorithmOverloadedError",
     "AlgorithmUnexpectedError",
 ]
@@ -27,7 +27,13 @@ class ErrorMessageEnum(StrEnum):
     NOT_DICT_OUTPUTS = "Выходные данные алгоритма не формате словаря"
     NON_INT_TIMEOUT = "Параметр execute_timeout не является целым числом"
     NEG_INT_TIMEOUT = "Значение параметра execute_timeout меньше нуля"
+    NEG_BUILD_WORKERS = "Значение параметра build_workers меньше нуля"
     UNIT_TEST_FAILED = "Модульные тесты для алгоритма завершились с ошибкой"
     NO_ALGORITHMS = "Алгоритмов не найдено"
     TIME_OVER = "Время для выполнения алгоритма истекло"
     UNEXPECTED_ERROR = "Что-то пошло не так..."
+    SERVER_OVERLOADED = "Сервер перегружен, повторите запрос позже"
+    SCALAR_AS_ARRAY = "Скалярное значение не может быть передано как массив"
+    ADMIN_DISABLED = "Администрирование приложения отключено"
+    INVALID_ADMIN_TOKEN = "Неверный токен администратора"
+    MSGPACK_UNAVAILABLE = "Формат MessagePack не поддерживается сервером"
@@ -33,4 +33,8 @@ class ErrorMessageTemplateEnum(StrEnum):
         "Алгоритм вернул элемент [{0}], не указанный в структуре выходных данных"
     )
     MISSED_OUTPUT = "Алгоритм не вернул значение для элемента выходных данных [{0}]"
+    BATCH_TOO_LARGE = (
+        "Количество наборов входных данных в пакетном вызове превышает {0}"
+    )
+    ALGORITHM_EXISTS = "Алгоритм с именем [{0}] уже существует"
     ALGORITHM_NOT_EXISTS = "Алгоритм с именем [{0}] не существует"
@@ -2,6 +2,14 @@ from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 
 
+def _restore_error(error_class: type, message: str) -> "AlgorithmError":
+    """Восстанавливает исключение с заданным сообщением без вызова конструктора
+    класса исключения."""
+    error = error_class.__new__(error_class)
+    AlgorithmError.__init__(error, message)
+    return error
+
+
 class AlgorithmError(Exception):
     """Базовый класс ошибок выполнения алгоритмов."""
 
@@ -11,6 +19,10 @@ class AlgorithmError(Exception):
         super().__init__(message)
         self.message = message
 
+    def __reduce__(self):
+        """Обеспечивает сериализацию исключения для передачи между процессами."""
+        return _restore_error, (self.__class__, self.message)
+
 
 class AlgorithmValueError(AlgorithmError):
     """Ошибка некорректного значения параметра при выполнении алгоритма."""
@@ -49,6 +61,13 @@ class AlgorithmUnexpectedError(AlgorithmError):
         super().__init__(ErrMsg.UNEXPECTED_ERROR)
 
 
+class AlgorithmOverloadedError(AlgorithmError):
+    """Ошибка превышения допустимого количества одновременных вызовов."""
+
+    def __init__(self):
+        super().__init__(ErrMsg.SERVER_OVERLOADED)
+
+
 class AlgorithmNotFoundError(AlgorithmError):
     """Ошибка отсутствия алгоритма."""
 
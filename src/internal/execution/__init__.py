@@ -0,0 +1,14 @@
+"""Классы пакета реализуют механизмы выполнения методов алгоритмов: в вызывающем
+потоке и в пуле заранее запущенных рабочих процессов."""
+
+from .execution_backend import ExecutionBackend
+from .execution_backend_enum import ExecutionBackendEnum
+from .inline_execution_backend import InlineExecutionBackend
+from .process_pool_execution_backend import ProcessPoolExecutionBackend
+
+__all__ = [
+    "ExecutionBackend",
+    "ExecutionBackendEnum",
+    "InlineExecutionBackend",
+    "ProcessPoolExecutionBackend",
+]
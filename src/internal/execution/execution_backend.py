@@ -0,0 +1,137 @@
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import Any, Callable
+
+from src.internal.errors import AlgorithmError, AlgorithmUnexpectedError
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors.exceptions import AlgorithmTypeError
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionBackend(ABC):
+    """Базовый класс механизма выполнения методов алгоритмов."""
+
+    @abstractmethod
+    def execute(
+        self, method: Callable, params: dict[str, Any], timeout: int
+    ) -> dict[str, Any]:
+        """Выполняет метод алгоритма с заданными входными данными.
+
+        :param method: метод, обеспечивающий выполнение алгоритма;
+        :type method: Callable
+        :param params: значения входных данных для выполнения алгоритма;
+        :type params: dict[str, Any]
+        :param timeout: время отведенное для выполнения алгоритма, 0 - без
+            ограничения;
+        :type timeout: int
+        :return: результаты выполнения метода алгоритма.
+        :rtype: dict[str, Any]
+        :raises AlgorithmError: при ошибке выполнения алгоритма.
+        """
+
+    def execute_stream(
+        self, method: Callable, params: dict[str, Any], timeout: int
+    ) -> dict[str, Any]:
+        """Выполняет метод алгоритма, выходные данные которого могут
+        формироваться постепенно. Значения выходных данных, возвращенные
+        методом в виде итераторов (например, генераторов), могут быть переданы
+        вызывающему коду без вычисления всех элементов. По умолчанию итераторы
+        вычисляются полностью, как при вызове execute.
+
+        :param method: метод, обеспечивающий выполнение алгоритма;
+        :type method: Callable
+        :param params: значения входных данных для выполнения алгоритма;
+        :type params: dict[str, Any]
+        :param timeout: время отведенное для вызова метода алгоритма, 0 - без
+            ограничения;
+        :type timeout: int
+        :return: результаты выполнения метода алгоритма.
+        :rtype: dict[str, Any]
+        :raises AlgorithmError: при ошибке выполнения алгоритма.
+        """
+        return self.execute(method, params, timeout)
+
+    def execute_many(
+        self, method: Callable, params_list: list[dict[str, Any]], timeout: int
+    ) -> Iterator[dict[str, Any] | AlgorithmError]:
+        """Выполняет метод алгоритма для каждого набора входных данных. Ошибка
+        выполнения одного набора не прерывает выполнение остальных. По умолчанию
+        наборы выполняются последовательно по мере получения результатов.
+
+        :param method: метод, обеспечивающий выполнение алгоритма;
+        :type method: Callable
+        :param params_list: наборы значений входных данных;
+        :type params_list: list[dict[str, Any]]
+        :param timeout: время отведенное для выполнения алгоритма с одним
+            набором входных данных, 0 - без ограничения;
+        :type timeout: int
+        :return: результаты выполнения метода или ошибки выполнения в порядке
+            наборов входных данных.
+        :rtype: Iterator[dict[str, Any] | AlgorithmError]
+        """
+        return (self.try_execute(method, params, timeout) for params in params_list)
+
+    def try_execute(
+        self, method: Callable, params: dict[str, Any], timeout: int
+    ) -> dict[str, Any] | AlgorithmError:
+        """Выполняет метод алгоритма и возвращает ошибку выполнения вместо
+        вызова исключения."""
+        try:
+            return self.execute(method, params, timeout)
+        except AlgorithmError as ex:
+            return ex
+
+    def invalidate(self, path: str) -> None:
+        """Сообщает об изменении файла с методами алгоритма. Методы из этого
+        файла, загруженные механизмом выполнения ранее, больше не используются.
+
+        :param path: путь к файлу с методами алгоритма.
+        :type path: str
+        """
+
+    def shutdown(self) -> None:
+        """Освобождает ресурсы, занятые механизмом выполнения."""
+
+    @classmethod
+    def call_method(
+        cls, method: Callable, params: dict[str, Any], materialize: bool = True
+    ) -> dict[str, Any]:
+        """Вызывает метод алгоритма и приводит возникающие ошибки к классам,
+        наследующим от AlgorithmError. Значения выходных данных, возвращенные
+        в виде итераторов, вычисляются в списки, либо, если materialize=False,
+        оборачиваются итераторами, приводящими ошибки к тем же классам."""
+        try:
+            outputs = method(**params)
+            if not isinstance(outputs, dict):
+                return outputs
+            return {
+                name: (
+                    (list(value) if materialize else cls.__guard_iterator(value))
+                    if isinstance(value, Iterator)
+                    else value
+                )
+                for name, value in outputs.items()
+            }
+        except AlgorithmError:
+            raise
+        except TypeError as ex:
+            if "unexpected keyword argument" in str(ex):
+                raise AlgorithmTypeError(ErrMsg.UNEXPECTED_PARAM)
+            raise
+        except Exception as ex:
+            logger.error(str(ex))
+            raise AlgorithmUnexpectedError()
+
+    @classmethod
+    def __guard_iterator(cls, iterator: Iterator) -> Iterator:
+        """Возвращает итератор, приводящий ошибки вычисления элементов к классам,
+        наследующим от AlgorithmError."""
+        try:
+            yield from iterator
+        except AlgorithmError:
+            raise
+        except Exception as ex:
+            logger.error(str(ex))
+            raise AlgorithmUnexpectedError()
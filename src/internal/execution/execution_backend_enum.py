@@ -0,0 +1,14 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class ExecutionBackendEnum(LowercaseStrEnum):
+    """Перечисление механизмов выполнения методов алгоритмов. Значения INLINE,
+    PROCESS соответствуют выполнению в вызывающем потоке и выполнению в пуле
+    рабочих процессов.
+
+    """
+
+    INLINE = auto()
+    PROCESS = auto()
@@ -0,0 +1,52 @@
+import signal
+import threading
+from typing import Any, Callable
+
+from src.internal.errors import AlgorithmTimeoutError
+from src.internal.execution.execution_backend import ExecutionBackend
+
+
+class InlineExecutionBackend(ExecutionBackend):
+    """Класс выполняет метод алгоритма в вызывающем потоке. Предельное время
+    выполнения контролируется сигналом SIGALRM, поэтому ограничение времени
+    работает только в главном потоке процесса, в остальных потоках метод
+    выполняется без ограничения времени."""
+
+    def execute(
+        self, method: Callable, params: dict[str, Any], timeout: int
+    ) -> dict[str, Any]:
+        """Выполняет метод алгоритма с заданными входными данными. Устанавливает
+        предельное время выполнения алгоритма."""
+        return self.__call_method(method, params, timeout, True)
+
+    def execute_stream(
+        self, method: Callable, params: dict[str, Any], timeout: int
+    ) -> dict[str, Any]:
+        """Выполняет метод алгоритма, не вычисляя значения выходных данных,
+        возвращенные в виде итераторов. Предельное время ограничивает только
+        вызов метода, элементы итераторов вычисляются вызывающим кодом."""
+        return self.__call_method(method, params, timeout, False)
+
+    def __call_method(
+        self, method: Callable, params: dict[str, Any], timeout: int, materialize: bool
+    ) -> dict[str, Any]:
+        """Вызывает метод алгоритма с ограничением времени выполнения."""
+        use_alarm = (
+            timeout > 0 and threading.current_thread() is threading.main_thread()
+        )
+        if use_alarm:
+            signal.signal(signal.SIGALRM, self.__get_timeout_handler(timeout))
+            signal.alarm(timeout)
+
+        try:
+            return self.call_method(method, params, materialize)
+        finally:
+            if use_alarm:
+                signal.alarm(0)
+
+    @staticmethod
+    def __get_timeout_handler(timeout: int):
+        def timeout_handler(signum, frame):
+            raise AlgorithmTimeoutError(timeout)
+
+        return timeout_handler
@@ -0,0 +1,237 @@
+import importlib.util
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable
+
+from src.internal.errors import (
+    AlgorithmError,
+    AlgorithmTimeoutError,
+    AlgorithmUnexpectedError,
+)
+from src.internal.execution.execution_backend import ExecutionBackend
+from src.internal.execution.inline_execution_backend import InlineExecutionBackend
+
+logger = logging.getLogger(__name__)
+
+WORKER_STOP_TIMEOUT = 1
+"""Время ожидания штатного завершения рабочего процесса."""
+
+
+class _Worker:
+    """Рабочий процесс пула и канал для обмена данными с ним."""
+
+    def __init__(self, process: BaseProcess, connection: Connection):
+        self.process = process
+        self.connection = connection
+
+    def stop(self) -> None:
+        """Завершает рабочий процесс."""
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(WORKER_STOP_TIMEOUT)
+        self.kill()
+
+    def kill(self) -> None:
+        """Принудительно завершает рабочий процесс."""
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+def _load_method(path: str, name: str) -> Callable:
+    """Импортирует метод алгоритма из файла с исходным кодом."""
+    spec = importlib.util.spec_from_file_location(os.path.basename(path), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def _worker_loop(connection: Connection, preload_paths: list[str]) -> None:
+    """Цикл обработки вызовов методов алгоритмов в рабочем процессе. Методы
+    загруженного модуля используются, пока не изменится поколение его файла."""
+    modules: dict[str, tuple[int, dict[str, Callable]]] = {}
+    for path in preload_paths:
+        try:
+            modules[path] = (0, {"main": _load_method(path, "main")})
+        except Exception as ex:
+            logger.error(str(ex))
+
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        path, name, generation, params = message
+        try:
+            if path not in modules or modules[path][0] != generation:
+                modules[path] = (generation, {})
+            methods = modules[path][1]
+            if name not in methods:
+                methods[name] = _load_method(path, name)
+            response = (True, ExecutionBackend.call_method(methods[name], params))
+        except Exception as ex:
+            response = (False, ex)
+        try:
+            connection.send(response)
+        except Exception as ex:
+            logger.error(str(ex))
+            connection.send((False, AlgorithmUnexpectedError()))
+
+
+class ProcessPoolExecutionBackend(ExecutionBackend):
+    """Класс выполняет методы алгоритмов в пуле заранее запущенных процессов.
+
+    При запуске рабочие процессы импортируют модули алгоритмов, поэтому вызовы
+    не тратят время на импорт. Каждый вызов выполняется в отдельном свободном
+    процессе, при истечении времени выполнения процесс завершается и заменяется
+    новым. Значения выходных данных, возвращенные методами в виде итераторов,
+    вычисляются в рабочем процессе полностью. Методы, которые невозможно
+    импортировать по пути к файлу (лямбда функции, вложенные функции),
+    выполняются в вызывающем потоке. Наборы входных данных пакетного вызова
+    распределяются по всем рабочим процессам.
+    """
+
+    def __init__(self, pool_size: int = 0, preload_paths: list[str] | None = None):
+        """Конструктор класса
+
+        :param pool_size: количество рабочих процессов, 0 - по количеству
+            процессоров;
+        :type pool_size: int
+        :param preload_paths: пути к файлам с методами алгоритмов, которые
+            импортируются при запуске рабочих процессов;
+        :type preload_paths: list[str] or None
+        """
+        self.__pool_size: int = pool_size or os.cpu_count() or 1
+        self.__preload_paths: list[str] = [
+            os.path.abspath(path) for path in preload_paths or []
+        ]
+        self.__context = multiprocessing.get_context("spawn")
+        self.__inline_backend = InlineExecutionBackend()
+        self.__lock = threading.Lock()
+        self.__workers: set[_Worker] = set()
+        self.__idle_workers: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self.__generations: dict[str, int] = {}
+        for _ in range(self.__pool_size):
+            self.__idle_workers.put(self.__start_worker())
+        self.__dispatcher = ThreadPoolExecutor(
+            max_workers=self.__pool_size, thread_name_prefix="dispatcher"
+        )
+
+    @property
+    def pool_size(self) -> int:
+        """Возвращает количество рабочих процессов.
+
+        :return: количество рабочих процессов.
+        :rtype: int
+        """
+        return self.__pool_size
+
+    def execute(
+        self, method: Callable, params: dict[str, Any], timeout: int
+    ) -> dict[str, Any]:
+        """Выполняет метод алгоритма в свободном рабочем процессе. При истечении
+        времени выполнения рабочий процесс завершается."""
+        location = self.__get_method_location(method)
+        if location is None:
+            return self.__inline_backend.execute(method, params, timeout)
+
+        worker = self.__acquire_worker()
+        try:
+            path, name = location
+            generation = self.__generations.get(path, 0)
+            worker.connection.send((path, name, generation, params))
+            if timeout > 0 and not worker.connection.poll(timeout):
+                raise AlgorithmTimeoutError(timeout)
+            is_success, result = worker.connection.recv()
+        except AlgorithmTimeoutError:
+            self.__replace_worker(worker)
+            raise
+        except (EOFError, OSError) as ex:
+            logger.error(str(ex))
+            self.__replace_worker(worker)
+            raise AlgorithmUnexpectedError()
+        self.__idle_workers.put(worker)
+
+        if not is_success:
+            raise result
+        return result
+
+    def execute_many(
+        self, method: Callable, params_list: list[dict[str, Any]], timeout: int
+    ) -> Iterator[dict[str, Any] | AlgorithmError]:
+        """Выполняет метод алгоритма для наборов входных данных параллельно
+        во всех рабочих процессах пула."""
+        if len(params_list) < 2:
+            return super().execute_many(method, params_list, timeout)
+        return self.__dispatcher.map(
+            lambda params: self.try_execute(method, params, timeout), params_list
+        )
+
+    def invalidate(self, path: str) -> None:
+        """Увеличивает поколение файла с методами алгоритма, при следующем
+        вызове рабочие процессы импортируют файл повторно."""
+        path = os.path.abspath(path)
+        with self.__lock:
+            self.__generations[path] = self.__generations.get(path, 0) + 1
+
+    def shutdown(self) -> None:
+        """Завершает все рабочие процессы пула."""
+        self.__dispatcher.shutdown(wait=False, cancel_futures=True)
+        with self.__lock:
+            workers = list(self.__workers)
+            self.__workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def __start_worker(self) -> _Worker:
+        """Запускает рабочий процесс."""
+        parent_connection, child_connection = self.__context.Pipe()
+        process = self.__context.Process(
+            target=_worker_loop,
+            args=(child_connection, self.__preload_paths),
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        worker = _Worker(process, parent_connection)
+        with self.__lock:
+            self.__workers.add(worker)
+        return worker
+
+    def __acquire_worker(self) -> _Worker:
+        """Ожидает освобождения рабочего процесса."""
+        worker = self.__idle_workers.get()
+        if not worker.process.is_alive():
+            self.__discard_worker(worker)
+            worker = self.__start_worker()
+        return worker
+
+    def __replace_worker(self, worker: _Worker) -> None:
+        """Завершает рабочий процесс и запускает вместо него новый."""
+        self.__discard_worker(worker)
+        self.__idle_workers.put(self.__start_worker())
+
+    def __discard_worker(self, worker: _Worker) -> None:
+        """Завершает рабочий процесс и исключает его из пула."""
+        with self.__lock:
+            self.__workers.discard(worker)
+        worker.kill()
+
+    @staticmethod
+    def __get_method_location(method: Callable) -> tuple[str, str] | None:
+        """Возвращает путь к файлу и имя метода, если метод может быть
+        импортирован в рабочем процессе."""
+        code = getattr(method, "__code__", None)
+        qualname = getattr(method, "__qualname__", "")
+        if code is None or "<" in qualname or not os.path.isfile(code.co_filename):
+            return None
+        return os.path.abspath(code.co_filename), method.__name__
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.internal.constants import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL
+from src.internal.data_dimension.data_array_converter import DataArrayConverter
+
+HITS = "hits"
+MISSES = "misses"
+
+
+class ResultCache:
+    """Класс реализует кэш результатов выполнения алгоритмов. Ключом кэша
+    является имя алгоритма и хэш канонического представления входных данных.
+    Размер кэша ограничен, при переполнении вытесняются давно не используемые
+    записи, записи старше заданного времени жизни не используются.
+    """
+
+    def __init__(
+        self, max_size: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL
+    ):
+        """Конструктор класса
+
+        :param max_size: максимальное количество записей в кэше;
+        :type max_size: int
+        :param ttl: время жизни записи в секундах, 0 - без ограничения;
+        :type ttl: float
+        """
+        self.__max_size: int = max_size
+        self.__ttl: float = ttl
+        self.__entries: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self.__statistics: dict[str, dict[str, int]] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Возвращает количество записей в кэше."""
+        return len(self.__entries)
+
+    def get(self, algorithm_name: str, params: dict[str, Any]) -> dict | None:
+        """Возвращает сохраненный результат выполнения алгоритма.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param params: значения входных данных алгоритма;
+        :type params: dict[str, Any]
+        :return: результат выполнения алгоритма или None при его отсутствии.
+        :rtype: dict or None
+        """
+        key = (algorithm_name, self.__get_params_hash(params))
+        with self.__lock:
+            statistics = self.__statistics.setdefault(
+                algorithm_name, {HITS: 0, MISSES: 0}
+            )
+            entry = self.__entries.get(key)
+            if entry is not None and self.__is_expired(entry[0]):
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                statistics[MISSES] += 1
+                return None
+            self.__entries.move_to_end(key)
+            statistics[HITS] += 1
+            return entry[1]
+
+    def put(self, algorithm_name: str, params: dict[str, Any], outputs: dict) -> None:
+        """Сохраняет результат выполнения алгоритма.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param params: значения входных данных алгоритма;
+        :type params: dict[str, Any]
+        :param outputs: результат выполнения алгоритма.
+        :type outputs: dict
+        """
+        key = (algorithm_name, self.__get_params_hash(params))
+        with self.__lock:
+            self.__entries[key] = (time.monotonic(), outputs)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, algorithm_name: str) -> None:
+        """Удаляет из кэша все результаты выполнения алгоритма.
+
+        :param algorithm_name: имя алгоритма.
+        :type algorithm_name: str
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if key[0] == algorithm_name]:
+                del self.__entries[key]
+
+    def get_statistics(self) -> dict[str, dict[str, int]]:
+        """Возвращает количество попаданий и промахов кэша по алгоритмам.
+
+        :return: словарь с ключами hits и misses для каждого алгоритма.
+        :rtype: dict[str, dict[str, int]]
+        """
+        with self.__lock:
+            return {name: dict(stat) for name, stat in self.__statistics.items()}
+
+    def __is_expired(self, created: float) -> bool:
+        """Проверяет истечение времени жизни записи."""
+        return self.__ttl > 0 and time.monotonic() - created > self.__ttl
+
+    @staticmethod
+    def __get_params_hash(params: dict[str, Any]) -> str:
+        """Возвращает хэш канонического представления входных данных."""
+        canonical = json.dumps(
+            params,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=DataArrayConverter.to_list,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class CatalogReloadSchema(BaseModel):
+    """Класс представляет результат повторной загрузки каталога алгоритмов."""
+
+    added: list[str] = Field([], description="Имена добавленных алгоритмов")
+    updated: list[str] = Field([], description="Имена обновленных алгоритмов")
+    removed: list[str] = Field([], description="Имена удаленных алгоритмов")
+    failed: dict[str, str] = Field(
+        {},
+        description="Сообщения об ошибках сборки по каталогам алгоритмов, "
+        "для которых продолжает использоваться предыдущая версия",
+    )
+
+
+if __name__ == "__main__":
+    print(CatalogReloadSchema(added=["fibonacci"]).model_dump())
@@ -1,11 +1,12 @@
 from typing import Self
 
-from pydantic import ConfigDict, model_validator
+from pydantic import ConfigDict, Field, model_validator
 
 from src.internal.data_dimension.data_dimension import DataDimension
 from src.internal.data_dimension.data_dimension_checker import DataDimensionChecker
 from src.internal.data_dimension.data_shape_enum import DataShapeEnum
 from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.schemas.definition_schema import DefinitionSchema
 
 ValueType = int | float | str | bool
@@ -16,13 +17,18 @@ OptionalValueMatrixType = ValueMatrixType | None
 
 
 class DataDefinitionSchema(DefinitionSchema, DataDimension):
-    """Класс представляет описание элемента входных или выходных данных для алгоритма"""
+    """Класс представляет описание элемента входных или выходных данных для алгоритма.
+
+    Флаг as_array указывает, что проверенные списки и матрицы передаются
+    в метод алгоритма в виде массивов NumPy. Флаг не входит в описание
+    алгоритма, возвращаемое клиентам."""
 
     model_config = ConfigDict(frozen=True)
 
     data_type: DataTypeEnum
     data_shape: DataShapeEnum
     default_value: ValueType | ValueListType | ValueMatrixType
+    as_array: bool = Field(False, exclude=True)
 
     def __str__(self) -> str:
         """Возвращает строковое представление экземпляра класса"""
@@ -40,6 +46,13 @@ class DataDefinitionSchema(DefinitionSchema, DataDimension):
             raise ValueError(error)
         return self
 
+    @model_validator(mode="after")
+    def validate_as_array(self) -> Self:
+        """Проверяет, что в виде массива передаются только списки и матрицы"""
+        if self.as_array and self.data_shape == DataShapeEnum.SCALAR:
+            raise ValueError(ErrMsg.SCALAR_AS_ARRAY)
+        return self
+
 
 if __name__ == "__main__":
     data = DataDefinitionSchema(
@@ -7,7 +7,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import LOGGING_CONFIG, Settings
 from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.algorithm_scheduler import AlgorithmScheduler
+from src.routers.admin import router as admin_router
 from src.routers.algorithms import router as algorithms_router
+from src.routers.catalog_cache import CatalogResponseCache
 from src.routers.error_handlers import init_error_handlers
 
 
@@ -31,11 +34,30 @@ def create_app(settings: Settings = None) -> FastAPI:
         version=settings.VERSION,
     )
     app.include_router(router=algorithms_router)
+    app.include_router(router=admin_router)
     init_error_handlers(app, logger)
     app.state.algorithms = AlgorithmCollection(
         algorithms_catalog_path=settings.ALGORITHMS_CATALOG_PATH,
         execute_timeout=settings.EXECUTE_TIMEOUT,
+        execution_backend=settings.EXECUTION_BACKEND,
+        process_pool_size=settings.PROCESS_POOL_SIZE,
+        result_cache_size=settings.RESULT_CACHE_SIZE,
+        result_cache_ttl=settings.RESULT_CACHE_TTL,
+        max_batch_size=settings.BATCH_MAX_SIZE,
+        build_workers=settings.BUILD_WORKERS,
+        build_manifest_path=settings.BUILD_MANIFEST_PATH,
+        lazy_loading=settings.LAZY_LOADING,
+        warm_up=settings.WARM_UP,
+        watch_interval=settings.CATALOG_WATCH_INTERVAL,
     )
+    app.state.catalog_cache = CatalogResponseCache(app.state.algorithms)
+    app.state.admin_token = settings.ADMIN_TOKEN
+    app.state.scheduler = AlgorithmScheduler(
+        max_workers=settings.SCHEDULER_MAX_WORKERS,
+        max_queue_size=settings.SCHEDULER_QUEUE_SIZE,
+    )
+    app.add_event_handler("shutdown", app.state.scheduler.shutdown)
+    app.add_event_handler("shutdown", app.state.algorithms.shutdown)
 
     if settings.BACKEND_CORS_ORIGINS:
         app.add_middleware(
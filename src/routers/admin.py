@@ -0,0 +1,43 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.algorithm_scheduler import AlgorithmScheduler
+from src.internal.constants import ADMIN_ENDPOINT
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.schemas.catalog_reload_schema import CatalogReloadSchema
+from src.routers.algorithms import get_app_algorithms, get_app_scheduler
+
+
+def check_admin_token(request: Request, x_admin_token: str = Header("")) -> None:
+    """Проверяет токен администратора. Если токен не задан в параметрах
+    приложения, конечные точки администрирования недоступны."""
+    admin_token = request.app.state.admin_token
+    if not admin_token:
+        raise HTTPException(status_code=404, detail=ErrMsg.ADMIN_DISABLED)
+    if not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=403, detail=ErrMsg.INVALID_ADMIN_TOKEN)
+
+
+router = APIRouter(
+    prefix=ADMIN_ENDPOINT,
+    dependencies=[Depends(check_admin_token)],
+)
+
+
+@router.post(
+    "/reload",
+    response_model=CatalogReloadSchema,
+    summary="Загрузить каталог алгоритмов повторно",
+    description="Пересобирает алгоритмы, файлы которых изменились, добавляет "
+    "новые и исключает удаленные алгоритмы без перезапуска приложения. Требует "
+    "токен администратора в заголовке X-Admin-Token.",
+    response_description="Имена добавленных, обновленных и удаленных алгоритмов "
+    "и ошибки сборки.",
+)
+async def reload_algorithms(
+    algorithms: AlgorithmCollection = Depends(get_app_algorithms),
+    scheduler: AlgorithmScheduler = Depends(get_app_scheduler),
+) -> CatalogReloadSchema:
+    return await scheduler.run(algorithms.reload)
@@ -1,19 +1,47 @@
 import logging
-import math
 
-from fastapi import APIRouter, Body, Depends, Path, Request
+from fastapi import APIRouter, Body, Depends, Path, Request, Response
 
 from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.algorithm_scheduler import AlgorithmScheduler
 from src.internal.constants import ALGORITHMS_ENDPOINT
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
-from src.internal.schemas.data_element_schema import DataElementsSchema
-from src.routers.schemas import AlgorithmsPageSchema, PaginateInputSchema
+from src.internal.schemas.data_element_schema import (
+    DataElementSchema,
+    DataElementsSchema,
+)
+from src.routers.catalog_cache import CatalogResponseCache, cached_json_response
+from src.routers.fast_json import (
+    FastJSONResponse,
+    get_batch_result_content,
+    get_elements_content,
+)
+from src.routers.msgpack_format import (
+    MSGPACK_MEDIA_TYPE,
+    accepts_msgpack,
+    get_request_parameters,
+    msgpack_response,
+)
+from src.routers.schemas import (
+    AlgorithmsPageSchema,
+    BatchResultSchema,
+    PaginateInputSchema,
+)
+from src.routers.streaming import NDJSON_MEDIA_TYPE, accepts_ndjson, ndjson_response
 
 
 def get_app_algorithms(request: Request) -> AlgorithmCollection:
     return request.app.state.algorithms
 
 
+def get_app_scheduler(request: Request) -> AlgorithmScheduler:
+    return request.app.state.scheduler
+
+
+def get_app_catalog_cache(request: Request) -> CatalogResponseCache:
+    return request.app.state.catalog_cache
+
+
 router = APIRouter(
     prefix=ALGORITHMS_ENDPOINT,
 )
@@ -24,23 +52,19 @@ logger = logging.getLogger(__name__)
     "/",
     response_model=AlgorithmsPageSchema,
     summary="Получить алгоритмы",
-    description="Возвращает список имеющихся алгоритмов с постраничным выводом.",
+    description="Возвращает список имеющихся алгоритмов с постраничным выводом. "
+    "Ответ содержит заголовок ETag, при совпадении которого с заголовком запроса "
+    "If-None-Match возвращается ответ 304 без тела.",
     response_description="Список алгоритмов с информацией о постраничном выводе.",
+    responses={304: {"description": "Список алгоритмов не изменился."}},
 )
 async def get_algorithms(
+    request: Request,
     paginate: PaginateInputSchema = Depends(),
-    algorithms: AlgorithmCollection = Depends(get_app_algorithms),
-) -> AlgorithmsPageSchema:
-    offset_min = (paginate.page - 1) * paginate.size
-    offset_max = paginate.page * paginate.size
-    algorithm_list = algorithms.get_algorithm_list()
-
-    return AlgorithmsPageSchema(
-        items=algorithm_list[offset_min:offset_max],
-        total=len(algorithm_list),
-        page=paginate.page,
-        size=paginate.size,
-        pages=math.ceil(len(algorithm_list) / paginate.size),
+    catalog_cache: CatalogResponseCache = Depends(get_app_catalog_cache),
+) -> Response:
+    return cached_json_response(
+        request, catalog_cache.get_page(paginate.page, paginate.size)
     )
 
 
@@ -48,28 +72,97 @@ async def get_algorithms(
     "/{algorithm_name}",
     response_model=AlgorithmDefinitionSchema,
     summary="Получить описание алгоритма",
-    description="Возвращает информацию об алгоритме по его названию.",
+    description="Возвращает информацию об алгоритме по его названию. Ответ "
+    "содержит заголовок ETag, при совпадении которого с заголовком запроса "
+    "If-None-Match возвращается ответ 304 без тела.",
     response_description="Информация об алгоритме.",
+    responses={304: {"description": "Описание алгоритма не изменилось."}},
 )
 async def get_algorithm(
+    request: Request,
     algorithm_name: str = Path(..., description="Название алгоритма"),
-    algorithms: AlgorithmCollection = Depends(get_app_algorithms),
-) -> AlgorithmDefinitionSchema:
-    return algorithms.get_algorithm_definition(algorithm_name)
+    catalog_cache: CatalogResponseCache = Depends(get_app_catalog_cache),
+) -> Response:
+    return cached_json_response(request, catalog_cache.get_definition(algorithm_name))
 
 
 @router.post(
     "/{algorithm_name}/results",
     response_model=DataElementsSchema,
     summary="Получить результат выполнения алгоритма",
-    description="Возвращает результат выполнения выбранного алгоритма.",
+    description="Возвращает результат выполнения выбранного алгоритма. При "
+    f"заголовке Accept: {NDJSON_MEDIA_TYPE} результаты передаются потоком по "
+    "мере вычисления: скалярные значения строками с ключами name и value, "
+    "элементы списков и строки матриц строками с ключами name и item. Входные "
+    f"данные и результаты могут передаваться в формате {MSGPACK_MEDIA_TYPE} "
+    "(заголовки Content-Type и Accept), списки и матрицы с числовыми и "
+    "логическими элементами при этом передаются как массивы NumPy в формате .npy "
+    "в типе расширения MessagePack с кодом 1.",
     response_description="Результаты выполнения алгоритма.",
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}, MSGPACK_MEDIA_TYPE: {}}},
+        415: {"description": "Формат MessagePack не поддерживается сервером."},
+    },
+    openapi_extra={
+        "requestBody": {
+            "description": "Значения параметров для выполнения алгоритма",
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/DataElementsSchema"}
+                },
+                MSGPACK_MEDIA_TYPE: {},
+            },
+        }
+    },
 )
 async def get_algorithm_result(
-    parameters: DataElementsSchema = Body(
-        ..., description="Значения параметров для выполнения алгоритма"
+    request: Request,
+    parameters: list[DataElementSchema] = Depends(get_request_parameters),
+    algorithm_name: str = Path(..., description="Название алгоритма"),
+    algorithms: AlgorithmCollection = Depends(get_app_algorithms),
+    scheduler: AlgorithmScheduler = Depends(get_app_scheduler),
+) -> Response:
+    if accepts_ndjson(request):
+        lines = await scheduler.run(
+            algorithms.get_algorithm_stream, algorithm_name, parameters
+        )
+        return ndjson_response(lines)
+    result = await scheduler.run(
+        algorithms.get_algorithm_result, algorithm_name, parameters
+    )
+    if accepts_msgpack(request):
+        definition = algorithms.get_algorithm_definition(algorithm_name)
+        return msgpack_response(result, definition.outputs)
+    return FastJSONResponse(get_elements_content(result))
+
+
+@router.post(
+    "/{algorithm_name}/results:batch",
+    response_model=list[BatchResultSchema],
+    summary="Получить результаты пакетного выполнения алгоритма",
+    description="Выполняет выбранный алгоритм для каждого набора входных данных "
+    "и возвращает результаты и ошибки в порядке наборов. При заголовке "
+    f"Accept: {NDJSON_MEDIA_TYPE} результат каждого набора передается отдельной "
+    "строкой по мере завершения выполнения.",
+    response_description="Результаты выполнения алгоритма для наборов данных.",
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def get_algorithm_batch_result(
+    request: Request,
+    parameters_list: list[DataElementsSchema] = Body(
+        ..., description="Наборы значений параметров для выполнения алгоритма"
     ),
     algorithm_name: str = Path(..., description="Название алгоритма"),
     algorithms: AlgorithmCollection = Depends(get_app_algorithms),
-) -> DataElementsSchema:
-    return algorithms.get_algorithm_result(algorithm_name, parameters)
+    scheduler: AlgorithmScheduler = Depends(get_app_scheduler),
+) -> Response:
+    if accepts_ndjson(request):
+        results = await scheduler.run(
+            algorithms.get_algorithm_batch_stream, algorithm_name, parameters_list
+        )
+        return ndjson_response(get_batch_result_content(result) for result in results)
+    results = await scheduler.run(
+        algorithms.get_algorithm_batch_result, algorithm_name, parameters_list
+    )
+    return FastJSONResponse([get_batch_result_content(result) for result in results])
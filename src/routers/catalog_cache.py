@@ -0,0 +1,110 @@
+import hashlib
+import math
+from typing import NamedTuple
+
+from fastapi import Request, Response
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.routers.schemas import AlgorithmsPageSchema
+
+JSON_MEDIA_TYPE = "application/json"
+"""Тип содержимого ответов с описаниями алгоритмов."""
+
+
+class CachedResponse(NamedTuple):
+    """Сериализованное тело ответа и его тег сущности."""
+
+    body: bytes
+    etag: str
+
+
+class CatalogResponseCache:
+    """Класс хранит сериализованные в JSON страницы списка алгоритмов и
+    описания алгоритмов. Каталог алгоритмов изменяется только при сборке и
+    повторной загрузке, поэтому ответы сериализуются один раз для каждой версии
+    каталога, а клиент, передавший актуальный тег сущности в заголовке
+    If-None-Match, получает ответ 304 без тела.
+    """
+
+    def __init__(self, algorithms: AlgorithmCollection):
+        """Конструктор класса
+
+        :param algorithms: набор алгоритмов.
+        :type algorithms: AlgorithmCollection
+        """
+        self.__algorithms: AlgorithmCollection = algorithms
+        self.__version: int = -1
+        self.__pages: dict[tuple[int, int], CachedResponse] = {}
+        self.__definitions: dict[str, CachedResponse] = {}
+
+    def get_page(self, page: int, size: int) -> CachedResponse:
+        """Возвращает сериализованную страницу списка алгоритмов.
+
+        :param page: номер страницы;
+        :type page: int
+        :param size: количество алгоритмов на странице.
+        :type size: int
+        :return: тело ответа и тег сущности.
+        :rtype: CachedResponse
+        """
+        self.__check_version()
+        key = (page, size)
+        if key not in self.__pages:
+            algorithm_list = self.__algorithms.get_algorithm_list()
+            page_schema = AlgorithmsPageSchema(
+                items=algorithm_list[(page - 1) * size : page * size],
+                total=len(algorithm_list),
+                page=page,
+                size=size,
+                pages=math.ceil(len(algorithm_list) / size),
+            )
+            self.__pages[key] = self.__create_response(
+                page_schema.model_dump_json(warnings=False)
+            )
+        return self.__pages[key]
+
+    def get_definition(self, algorithm_name: str) -> CachedResponse:
+        """Возвращает сериализованное описание алгоритма.
+
+        :param algorithm_name: имя алгоритма.
+        :type algorithm_name: str
+        :return: тело ответа и тег сущности.
+        :rtype: CachedResponse
+        :raises AlgorithmNotFoundError: если алгоритм с указанным именем
+            отсутствует.
+        """
+        self.__check_version()
+        if algorithm_name not in self.__definitions:
+            definition = self.__algorithms.get_algorithm_definition(algorithm_name)
+            self.__definitions[algorithm_name] = self.__create_response(
+                definition.model_dump_json(warnings=False)
+            )
+        return self.__definitions[algorithm_name]
+
+    def __check_version(self) -> None:
+        """Очищает сохраненные ответы при изменении версии каталога. Версия
+        считывается до чтения каталога, поэтому ответ, сериализованный во время
+        повторной загрузки, будет заменен при следующем обращении."""
+        version = self.__algorithms.catalog_version
+        if version != self.__version:
+            self.__pages = {}
+            self.__definitions = {}
+            self.__version = version
+
+    @staticmethod
+    def __create_response(content: str) -> CachedResponse:
+        """Создает сериализованный ответ с тегом сущности по хэшу тела."""
+        body = content.encode("utf-8")
+        return CachedResponse(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def cached_json_response(request: Request, cached: CachedResponse) -> Response:
+    """Создает ответ с сериализованным телом или ответ 304, если клиент
+    передал актуальный тег сущности в заголовке If-None-Match."""
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if cached.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(cached.body, media_type=JSON_MEDIA_TYPE, headers=headers)
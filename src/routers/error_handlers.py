@@ -6,6 +6,7 @@ from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors.exceptions import (
     AlgorithmError,
     AlgorithmNotFoundError,
+    AlgorithmOverloadedError,
     AlgorithmTypeError,
     AlgorithmValueError,
 )
@@ -33,6 +34,13 @@ def init_error_handlers(app: FastAPI, logger: Logger):
             detail=err.message,
         )
 
+    @app.exception_handler(AlgorithmOverloadedError)
+    def handle_overloaded_error(request: Request, err: AlgorithmOverloadedError):
+        raise HTTPException(
+            status_code=503,
+            detail=err.message,
+        )
+
     @app.exception_handler(AlgorithmError)
     def handle_algorithm_error(request: Request, err: AlgorithmError):
         raise HTTPException(
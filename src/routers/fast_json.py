@@ -0,0 +1,56 @@
+import json
+from typing import Any
+
+from fastapi import Response
+
+from src.internal.errors import AlgorithmError
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Сериализует объект в JSON. При наличии пакета orjson используется он,
+    иначе и для целых чисел, не помещающихся в 64 бита, используется модуль
+    json с теми же параметрами, что и в JSONResponse."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """Ответ в формате JSON, сериализуемый без обхода содержимого функцией
+    jsonable_encoder. Предназначен для данных, уже состоящих из значений
+    встроенных типов, например для проверенных результатов алгоритма."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def get_elements_content(elements: list[DataElementSchema]) -> list[dict[str, Any]]:
+    """Возвращает элементы данных в виде словарей для сериализации."""
+    return [{"name": element.name, "value": element.value} for element in elements]
+
+
+def get_batch_result_content(
+    result: list[DataElementSchema] | AlgorithmError,
+) -> dict[str, Any]:
+    """Возвращает результат выполнения набора входных данных пакетного вызова
+    в виде словаря для сериализации."""
+    if isinstance(result, AlgorithmError):
+        return {"outputs": None, "error": result.message}
+    return {"outputs": get_elements_content(result), "error": None}
@@ -0,0 +1,168 @@
+import io
+from typing import Any
+
+import numpy as np
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from src.internal.data_dimension.data_array_converter import DataArrayConverter
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.schemas.data_definition_schema import DataDefinitionSchema
+from src.internal.schemas.data_element_schema import (
+    DataElementSchema,
+    DataElementsSchema,
+)
+from src.routers.fast_json import FastJSONResponse, get_elements_content
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+"""Тип содержимого для передачи данных в формате MessagePack."""
+NPY_EXT_CODE = 1
+"""Код типа расширения MessagePack для массива NumPy в формате .npy."""
+_NPY_KINDS = "biuf"
+"""Виды типов данных массивов, передаваемых в формате .npy."""
+
+
+def is_msgpack_content(request: Request) -> bool:
+    """Проверяет, переданы ли входные данные в формате MessagePack."""
+    content_type = request.headers.get("content-type", "")
+    return content_type.split(";")[0].strip().lower() == MSGPACK_MEDIA_TYPE
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Проверяет, запрошены ли клиентом результаты в формате MessagePack."""
+    return msgpack is not None and MSGPACK_MEDIA_TYPE in request.headers.get(
+        "accept", ""
+    )
+
+
+async def get_request_parameters(request: Request) -> list[DataElementSchema]:
+    """Возвращает значения входных данных из тела запроса в формате JSON или
+    MessagePack. Списки и матрицы, переданные в MessagePack как массивы .npy,
+    передаются исполнителю алгоритма без преобразования в списки.
+
+    :raises HTTPException: если формат MessagePack не поддерживается;
+    :raises RequestValidationError: при некорректном теле запроса.
+    """
+    body = await request.body()
+    if not is_msgpack_content(request):
+        try:
+            return DataElementsSchema.model_validate_json(body).root
+        except ValidationError as ex:
+            raise RequestValidationError(_get_body_errors(ex))
+    if msgpack is None:
+        raise HTTPException(status_code=415, detail=ErrMsg.MSGPACK_UNAVAILABLE)
+    return decode_elements(body)
+
+
+def decode_elements(body: bytes) -> list[DataElementSchema]:
+    """Декодирует элементы данных из формата MessagePack.
+
+    :param body: тело запроса;
+    :type body: bytes
+    :return: элементы данных;
+    :rtype: list[DataElementSchema]
+    :raises RequestValidationError: при некорректном теле запроса.
+    """
+    try:
+        content = msgpack.unpackb(body, ext_hook=_decode_ext)
+    except Exception as ex:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "msgpack_invalid",
+                    "loc": ("body",),
+                    "msg": "MessagePack decode error",
+                    "input": {},
+                    "ctx": {"error": str(ex)},
+                }
+            ]
+        )
+    arrays = {}
+    if isinstance(content, list):
+        for index, item in enumerate(content):
+            if isinstance(item, dict) and isinstance(item.get("value"), np.ndarray):
+                arrays[index] = item["value"]
+                content[index] = {**item, "value": []}
+    try:
+        elements = DataElementsSchema.model_validate(content).root
+    except ValidationError as ex:
+        raise RequestValidationError(_get_body_errors(ex))
+    for index, array in arrays.items():
+        elements[index] = DataElementSchema.model_construct(
+            name=elements[index].name, value=array
+        )
+    return elements
+
+
+def encode_elements(
+    elements: list[DataElementSchema], definitions: list[DataDefinitionSchema]
+) -> bytes:
+    """Кодирует элементы данных в формат MessagePack. Списки и матрицы с
+    числовыми и логическими элементами передаются как массивы .npy.
+
+    :param elements: элементы данных;
+    :type elements: list[DataElementSchema]
+    :param definitions: описания элементов данных.
+    :type definitions: list[DataDefinitionSchema]
+    :return: закодированные элементы данных.
+    :rtype: bytes
+    :raises OverflowError: если целое число не помещается в 64 бита.
+    """
+    shapes = {definition.name: definition for definition in definitions}
+    content = []
+    for element in elements:
+        value = element.value
+        definition = shapes.get(element.name)
+        if definition is not None and definition.data_shape != DataShapeEnum.SCALAR:
+            value = DataArrayConverter.to_array(definition, value)
+        content.append({"name": element.name, "value": value})
+    return msgpack.packb(content, default=_encode_ext)
+
+
+def msgpack_response(
+    elements: list[DataElementSchema], definitions: list[DataDefinitionSchema]
+) -> Response:
+    """Создает ответ с элементами данных в формате MessagePack. Если значения
+    не могут быть представлены в MessagePack, например целые числа больше 64
+    бит, ответ передается в формате JSON."""
+    try:
+        body = encode_elements(elements, definitions)
+    except OverflowError:
+        return FastJSONResponse(get_elements_content(elements))
+    return Response(body, media_type=MSGPACK_MEDIA_TYPE)
+
+
+def _decode_ext(code: int, data: bytes) -> Any:
+    """Декодирует тип расширения MessagePack."""
+    if code != NPY_EXT_CODE:
+        return msgpack.ExtType(code, data)
+    array = np.load(io.BytesIO(data), allow_pickle=False)
+    if array.dtype.kind not in _NPY_KINDS + "U":
+        raise ValueError(array.dtype)
+    return array
+
+
+def _encode_ext(value: Any) -> Any:
+    """Кодирует массив NumPy в тип расширения MessagePack."""
+    if not isinstance(value, np.ndarray):
+        raise TypeError(type(value))
+    if value.dtype.kind not in _NPY_KINDS:
+        return value.tolist()
+    buffer = io.BytesIO()
+    np.save(buffer, value, allow_pickle=False)
+    return msgpack.ExtType(NPY_EXT_CODE, buffer.getvalue())
+
+
+def _get_body_errors(ex: ValidationError) -> list[dict[str, Any]]:
+    """Возвращает ошибки проверки тела запроса в формате FastAPI."""
+    return [
+        {**error, "loc": ("body", *error["loc"])}
+        for error in ex.errors(include_url=False)
+    ]
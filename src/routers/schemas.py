@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 
+from src.internal.schemas.data_element_schema import DataElementSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
 
 
@@ -15,6 +16,16 @@ class AlgorithmsPageSchema(BaseModel):
     pages: int = Field(..., description="Общее количество страниц")
 
 
+class BatchResultSchema(BaseModel):
+    """Класс для результата выполнения алгоритма с одним набором входных данных
+    в пакетном вызове."""
+
+    outputs: list[DataElementSchema] | None = Field(
+        None, description="Результаты выполнения алгоритма"
+    )
+    error: str | None = Field(None, description="Сообщение об ошибке выполнения")
+
+
 class PaginateInputSchema(BaseModel):
     """Класс для параметров постраничного вывода данных."""
 
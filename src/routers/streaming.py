@@ -0,0 +1,52 @@
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from src.internal.errors import AlgorithmError
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.routers.fast_json import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+"""Тип содержимого для потоковой передачи результатов."""
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Размер части потока в байтах, при достижении которого она передается клиенту."""
+
+logger = logging.getLogger(__name__)
+
+
+def accepts_ndjson(request: Request) -> bool:
+    """Проверяет, запрошена ли клиентом потоковая передача результатов."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(lines: Iterator[dict[str, Any]]) -> StreamingResponse:
+    """Создает ответ, передающий объекты в формате NDJSON по мере их
+    получения. Ошибка, возникшая во время передачи, передается последней
+    строкой в виде объекта с ключом error."""
+    return StreamingResponse(_encode_lines(lines), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _encode_lines(lines: Iterator[dict[str, Any]]) -> Iterator[bytes]:
+    """Сериализует объекты в строки JSON и объединяет их в части потока."""
+    chunk = bytearray()
+    try:
+        for line in lines:
+            chunk += _encode_line(line)
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+    except AlgorithmError as ex:
+        chunk += _encode_line({"error": ex.message})
+    except Exception as ex:
+        logger.error(str(ex))
+        chunk += _encode_line({"error": ErrMsg.UNEXPECTED_ERROR})
+    if chunk:
+        yield bytes(chunk)
+
+
+def _encode_line(line: dict[str, Any]) -> bytes:
+    """Сериализует объект в строку JSON."""
+    return dumps(line) + b"\n"
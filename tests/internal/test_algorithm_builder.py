@@ -1,6 +1,8 @@
 import pytest
 
+from src.internal import algorithm_builder
 from src.internal.algorithm_builder import AlgorithmBuilder
+from src.internal.constants import DEFAULT_TEST_FILE_NAME
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from tests import (
@@ -9,8 +11,12 @@ from tests import (
     FIB_FUNC,
     FIB_NAME,
     FIB_TESTS,
+    MOCK_TESTS,
     NOT_INT_CASES,
     NOT_STRING_CASES,
+    SUM_DEF,
+    SUM_FUNC,
+    SUM_NAME,
     WRONG_FIB_TESTS,
     Case,
 )
@@ -189,6 +195,50 @@ class TestAlgorithmBuilder:
 
         assert str(error.value) == ErrMsg.UNIT_TEST_FAILED
 
+    def test_negative_build_workers(self):
+        """Проверяет ошибку указания отрицательного количества процессов"""
+        with pytest.raises(ValueError) as error:
+            AlgorithmBuilder(build_workers=-1)
+        assert str(error.value) == ErrMsg.NEG_BUILD_WORKERS
+
+    def test_build_algorithms_parallel(self, algo_dir):
+        """Проверяет параллельное выполнение тестов алгоритмов и порядок
+        ошибок сборки"""
+        fib_dir = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, FIB_TESTS)
+        sum_dir = algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+        wrong_dir = algo_dir("wrong", FIB_DEF, FIB_FUNC, WRONG_FIB_TESTS)
+        builder = AlgorithmBuilder(build_workers=2)
+
+        executors = builder.build_algorithms([fib_dir, sum_dir])
+        assert [executor.definition.name for executor in executors] == [
+            FIB_NAME,
+            SUM_NAME,
+        ]
+        with pytest.raises(RuntimeError) as error:
+            builder.build_algorithms([fib_dir, wrong_dir, sum_dir])
+        assert str(error.value) == ErrMsg.UNIT_TEST_FAILED
+
+    def test_build_manifest(self, algo_dir, tmp_path, monkeypatch):
+        """Проверяет пропуск тестов неизмененного алгоритма"""
+        dir_name = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, FIB_TESTS)
+        manifest_path = str(tmp_path / "manifest.json")
+        tested = []
+
+        def run_tests(test_file_path):
+            tested.append(test_file_path)
+            return True
+
+        monkeypatch.setattr(algorithm_builder, "_run_tests", run_tests)
+        builder = AlgorithmBuilder(manifest_path=manifest_path)
+        builder.build_algorithm(dir_name)
+        builder.build_algorithm(dir_name)
+        assert len(tested) == 1
+
+        with open(dir_name + "/" + DEFAULT_TEST_FILE_NAME, "a") as file:
+            file.write("\n")
+        builder.build_algorithm(dir_name)
+        assert len(tested) == 2
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestAlgorithmBuilder"])
@@ -1,14 +1,24 @@
+import shutil
+import time
+
 import pytest
 
 from src.internal.algorithm_collection import AlgorithmCollection
-from src.internal.constants import DEFAULT_ALGORITHMS_CATALOG_PATH
+from src.internal.constants import (
+    DEFAULT_ALGORITHMS_CATALOG_PATH,
+    DEFAULT_FUNCTION_FILE_NAME,
+)
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
-from src.internal.errors.exceptions import AlgorithmNotFoundError
+from src.internal.errors.exceptions import AlgorithmNotFoundError, AlgorithmRuntimeError
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from src.internal.schemas.catalog_reload_schema import CatalogReloadSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
 from tests import (
+    BOOL_DEF,
+    BOOL_FUNC,
+    BOOL_NAME,
     FIB_DEF,
     FIB_FUNC,
     FIB_NAME,
@@ -112,6 +122,156 @@ class TestAlgorithmCollection:
         algorithms = algo_collection.get_algorithm_list()
         assert len(algorithms) > 0
 
+    def test_lazy_loading(self, fib_algo_dir, tmp_path):
+        """Проверяет сборку алгоритма при первом обращении к нему"""
+        algo_collection = AlgorithmCollection(str(tmp_path), lazy_loading=True)
+
+        assert algo_collection.has_algorithm(FIB_NAME)
+        assert not algo_collection.is_algorithm_loaded(FIB_NAME)
+        assert algo_collection.get_algorithm_list()[0].name == FIB_NAME
+        assert algo_collection.get_cold_start_durations() == {}
+
+        result = algo_collection.get_algorithm_result(
+            FIB_NAME, [DataElementSchema(name="n", value=10)]
+        )
+
+        assert result == [DataElementSchema(name="result", value=55)]
+        assert algo_collection.is_algorithm_loaded(FIB_NAME)
+        assert algo_collection.get_cold_start_durations()[FIB_NAME] > 0
+
+    def test_lazy_loading_failed(self, tmp_path, algo_dir):
+        """Проверяет ошибку отложенной сборки алгоритма"""
+        algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, WRONG_FIB_TESTS)
+        algo_collection = AlgorithmCollection(str(tmp_path), lazy_loading=True)
+
+        with pytest.raises(AlgorithmRuntimeError) as error:
+            algo_collection.get_algorithm_result(
+                FIB_NAME, [DataElementSchema(name="n", value=10)]
+            )
+        assert str(error.value) == ErrMsgTmpl.EXECUTION_FAILED.format(
+            ErrMsg.UNIT_TEST_FAILED
+        )
+        assert not algo_collection.is_algorithm_loaded(FIB_NAME)
+
+    def test_warm_up(self, fib_algo_dir, tmp_path):
+        """Проверяет фоновую сборку алгоритмов"""
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), lazy_loading=True, warm_up=True
+        )
+        deadline = time.monotonic() + 30
+        while not algo_collection.is_algorithm_loaded(FIB_NAME):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+
+        assert FIB_NAME in algo_collection.get_cold_start_durations()
+
+    def test_reload_unchanged(self, fib_algo_dir, tmp_path):
+        """Проверяет повторную загрузку неизмененного каталога"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+
+        assert algo_collection.reload() == CatalogReloadSchema()
+        assert algo_collection.catalog_version == 0
+
+    def test_reload(self, algo_dir, tmp_path):
+        """Проверяет добавление, обновление и удаление алгоритмов при
+        повторной загрузке каталога"""
+        fib_path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+        algo_collection = AlgorithmCollection(str(tmp_path), execute_timeout=0)
+        params = [
+            DataElementSchema(name="a", value=2),
+            DataElementSchema(name="b", value=3),
+        ]
+        algo_collection.get_algorithm_result(SUM_NAME, params)
+
+        (tmp_path / SUM_NAME / DEFAULT_FUNCTION_FILE_NAME).write_text(
+            SUM_FUNC.replace("a + b", "max(a, b) * 2"), encoding="utf-8"
+        )
+        algo_dir(BOOL_NAME, BOOL_DEF, BOOL_FUNC, MOCK_TESTS)
+        shutil.rmtree(fib_path)
+
+        assert algo_collection.reload() == CatalogReloadSchema(
+            added=[BOOL_NAME], updated=[SUM_NAME], removed=[FIB_NAME]
+        )
+        assert algo_collection.catalog_version == 1
+        assert not algo_collection.has_algorithm(FIB_NAME)
+        assert algo_collection.has_algorithm(BOOL_NAME)
+        assert algo_collection.get_algorithm_result(SUM_NAME, params) == [
+            DataElementSchema(name="result", value=6)
+        ]
+        assert algo_collection.get_cache_statistics()[SUM_NAME]["hits"] == 0
+
+    def test_reload_failed(self, algo_dir, tmp_path):
+        """Проверяет использование предыдущей версии алгоритма при ошибке
+        повторной сборки"""
+        sum_path = algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+        algo_collection = AlgorithmCollection(str(tmp_path), execute_timeout=0)
+        (tmp_path / SUM_NAME / DEFAULT_FUNCTION_FILE_NAME).write_text(
+            "def main(a, b):\n    return {'result': str(a)}", encoding="utf-8"
+        )
+
+        result = algo_collection.reload()
+
+        assert list(result.failed) == [sum_path]
+        assert result.updated == []
+        assert algo_collection.get_algorithm_result(
+            SUM_NAME,
+            [
+                DataElementSchema(name="a", value=2),
+                DataElementSchema(name="b", value=3),
+            ],
+        ) == [DataElementSchema(name="result", value=5)]
+        assert algo_collection.reload() == CatalogReloadSchema()
+
+    def test_reload_name_conflict(self, algo_dir, tmp_path):
+        """Проверяет ошибку повторной загрузки алгоритма с существующим именем"""
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+        algo_collection = AlgorithmCollection(str(tmp_path), execute_timeout=0)
+        copy_path = algo_dir("sum_copy", SUM_DEF, SUM_FUNC, MOCK_TESTS)
+
+        result = algo_collection.reload()
+
+        assert result.added == []
+        assert result.failed == {
+            copy_path: ErrMsgTmpl.ALGORITHM_EXISTS.format(SUM_NAME)
+        }
+
+    def test_reload_lazy(self, algo_dir, tmp_path):
+        """Проверяет отложенную сборку обновленного алгоритма"""
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), execute_timeout=0, lazy_loading=True
+        )
+        params = [
+            DataElementSchema(name="a", value=2),
+            DataElementSchema(name="b", value=3),
+        ]
+        algo_collection.get_algorithm_result(SUM_NAME, params)
+        (tmp_path / SUM_NAME / DEFAULT_FUNCTION_FILE_NAME).write_text(
+            SUM_FUNC.replace("a + b", "max(a, b) * 2"), encoding="utf-8"
+        )
+
+        assert algo_collection.reload().updated == [SUM_NAME]
+        assert not algo_collection.is_algorithm_loaded(SUM_NAME)
+        assert algo_collection.get_algorithm_result(SUM_NAME, params) == [
+            DataElementSchema(name="result", value=6)
+        ]
+
+    def test_watch(self, algo_dir, tmp_path):
+        """Проверяет отслеживание изменений в каталоге алгоритмов"""
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), execute_timeout=0, watch_interval=0.05
+        )
+        try:
+            algo_dir(BOOL_NAME, BOOL_DEF, BOOL_FUNC, MOCK_TESTS)
+            deadline = time.monotonic() + 30
+            while not algo_collection.has_algorithm(BOOL_NAME):
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+        finally:
+            algo_collection.shutdown()
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestAlgorithmCollection"])
@@ -1,9 +1,12 @@
 import time
 
+import numpy as np
 import pytest
 
 from src.internal.algorithm_executor import AlgorithmExecutor
 from src.internal.constants import DEFAULT_TIMEOUT
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from src.internal.errors.exceptions import (
@@ -12,7 +15,9 @@ from src.internal.errors.exceptions import (
     AlgorithmUnexpectedError,
     AlgorithmValueError,
 )
+from src.internal.schemas.data_definition_schema import DataDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
+from src.internal.schemas.output_definition_schema import OutputDefinitionSchema
 from tests import NOT_INT_CASES, SCALAR_CASES, Case
 
 
@@ -349,6 +354,131 @@ class TestAlgorithmExecutor:
             algo_executor.execute(params)
         assert str(error.value) == ErrMsg.UNEXPECTED_ERROR
 
+    def test_execute_batch(self, create_algo_definition):
+        """Проверяет пакетное выполнение алгоритма с ошибками в отдельных
+        наборах входных данных"""
+        algo_definition = create_algo_definition()
+
+        def method(x):
+            if x < 0:
+                raise AlgorithmValueError("negative")
+            return {"y": x}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method)
+        results = algo_executor.execute_batch(
+            [
+                [DataElementSchema(name="x", value=10)],
+                [DataElementSchema(name="x", value="10")],
+                [DataElementSchema(name="x", value=-1)],
+                [DataElementSchema(name="z", value=1)],
+            ]
+        )
+
+        assert results[0] == [DataElementSchema(name="y", value=10)]
+        assert isinstance(results[1], AlgorithmTypeError)
+        assert str(results[1]) == ErrMsgTmpl.MISMATCH_VALUE_TYPE.format("int")
+        assert isinstance(results[2], AlgorithmValueError)
+        assert str(results[2]) == "negative"
+        assert isinstance(results[3], AlgorithmValueError)
+        assert str(results[3]) == ErrMsgTmpl.REDUNDANT_PARAMETER.format("z")
+
+    def test_execute_stream(self, create_algo_definition):
+        """Проверяет поэлементную передачу значения, возвращенного методом
+        в виде генератора"""
+        algo_definition = create_algo_definition(
+            outputs=[
+                OutputDefinitionSchema(
+                    name="y",
+                    title="Y",
+                    description="Y description",
+                    data_type=DataTypeEnum.INT,
+                    data_shape=DataShapeEnum.LIST,
+                    default_value=[0],
+                ),
+                OutputDefinitionSchema(
+                    name="n",
+                    title="N",
+                    description="N description",
+                    data_type=DataTypeEnum.INT,
+                    data_shape=DataShapeEnum.SCALAR,
+                    default_value=1,
+                ),
+            ]
+        )
+        produced = []
+
+        def generate(x):
+            for i in range(x):
+                produced.append(i)
+                yield i if i < 3 else "3"
+
+        def method(x):
+            return {"y": generate(x), "n": x}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method)
+        produced.clear()
+        parts = algo_executor.execute_stream([DataElementSchema(name="x", value=3)])
+
+        assert produced == []
+        assert next(parts) == {"name": "y", "item": 0}
+        assert produced == [0]
+        assert list(parts) == [
+            {"name": "y", "item": 1},
+            {"name": "y", "item": 2},
+            {"name": "n", "value": 3},
+        ]
+        assert algo_executor.execute([DataElementSchema(name="x", value=2)]) == [
+            DataElementSchema(name="y", value=[0, 1]),
+            DataElementSchema(name="n", value=2),
+        ]
+
+        parts = algo_executor.execute_stream([DataElementSchema(name="x", value=5)])
+        with pytest.raises(AlgorithmTypeError) as error:
+            list(parts)
+        assert str(error.value) == ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(
+            3, DataTypeEnum.INT
+        )
+
+    def test_execute_as_array(self, create_algo_definition):
+        """Проверяет передачу матриц в метод в виде массивов NumPy и
+        преобразование возвращенного массива в список"""
+        algo_definition = create_algo_definition(
+            parameters=[
+                DataDefinitionSchema(
+                    name="x",
+                    title="X",
+                    description="X description",
+                    data_type=DataTypeEnum.INT,
+                    data_shape=DataShapeEnum.MATRIX,
+                    default_value=[[1, 2]],
+                    as_array=True,
+                )
+            ],
+            outputs=[
+                OutputDefinitionSchema(
+                    name="y",
+                    title="Y",
+                    description="Y description",
+                    data_type=DataTypeEnum.INT,
+                    data_shape=DataShapeEnum.MATRIX,
+                    default_value=[[2, 4]],
+                )
+            ],
+        )
+        received = []
+
+        def method(x):
+            received.append(x)
+            return {"y": x * 2}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method)
+        outputs = algo_executor.execute(
+            [DataElementSchema(name="x", value=[[1, 2], [3, 4]])]
+        )
+
+        assert isinstance(received[-1], np.ndarray)
+        assert outputs == [DataElementSchema(name="y", value=[[2, 4], [6, 8]])]
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestAlgorithmExecutor"])
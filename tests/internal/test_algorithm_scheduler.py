@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.internal.algorithm_scheduler import AlgorithmScheduler
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors.exceptions import (
+    AlgorithmOverloadedError,
+    AlgorithmValueError,
+)
+
+
+@pytest.fixture()
+def scheduler():
+    """Создает планировщик с одним потоком и пустой очередью"""
+    scheduler = AlgorithmScheduler(max_workers=1, max_queue_size=0)
+    yield scheduler
+    scheduler.shutdown()
+
+
+class TestAlgorithmScheduler:
+    """Тесты для класса AlgorithmScheduler."""
+
+    def test_default_max_workers(self):
+        """Проверяет создание планировщика с параметрами по умолчанию"""
+        scheduler = AlgorithmScheduler()
+        try:
+            assert scheduler.max_workers > 0
+        finally:
+            scheduler.shutdown()
+
+    def test_run(self, scheduler):
+        """Проверяет выполнение функции вне потока цикла событий"""
+
+        def func(a, b):
+            return a + b, threading.current_thread()
+
+        result, thread = asyncio.run(scheduler.run(func, 1, 2))
+
+        assert result == 3
+        assert thread is not threading.current_thread()
+        assert scheduler.pending == 0
+
+    def test_run_error(self, scheduler):
+        """Проверяет передачу ошибки выполнения функции"""
+
+        def func():
+            raise AlgorithmValueError("error")
+
+        with pytest.raises(AlgorithmValueError) as error:
+            asyncio.run(scheduler.run(func))
+        assert str(error.value) == "error"
+        assert scheduler.pending == 0
+
+    def test_overloaded(self, scheduler):
+        """Проверяет отклонение вызова при заполненной очереди"""
+        started = threading.Event()
+        finish = threading.Event()
+
+        def func():
+            started.set()
+            finish.wait()
+            return 1
+
+        async def run_concurrently():
+            first = asyncio.ensure_future(scheduler.run(func))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            with pytest.raises(AlgorithmOverloadedError) as error:
+                await scheduler.run(func)
+            finish.set()
+            return await first, error
+
+        result, error = asyncio.run(run_concurrently())
+
+        assert result == 1
+        assert str(error.value) == ErrMsg.SERVER_OVERLOADED
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestAlgorithmScheduler"])
@@ -0,0 +1,53 @@
+import pytest
+
+from src.internal.build_manifest import BuildManifest
+
+
+class TestBuildManifest:
+    """Тесты для класса BuildManifest."""
+
+    def test_save_load(self, tmp_path):
+        """Проверяет сохранение и загрузку перечня сборки"""
+        path = str(tmp_path / "manifest.json")
+        manifest = BuildManifest(path)
+        manifest.set_passed("alg", "digest")
+        manifest.save()
+
+        loaded = BuildManifest(path)
+        assert loaded.is_passed("alg", "digest")
+        assert not loaded.is_passed("alg", "other")
+        assert not loaded.is_passed("other", "digest")
+
+    def test_disabled(self, tmp_path):
+        """Проверяет работу перечня без сохранения на диске"""
+        manifest = BuildManifest("")
+        manifest.set_passed("alg", "digest")
+        manifest.save()
+
+        assert manifest.is_passed("alg", "digest")
+        assert not BuildManifest("").is_passed("alg", "digest")
+
+    def test_corrupted(self, tmp_path):
+        """Проверяет загрузку поврежденного файла перечня"""
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert not BuildManifest(str(path)).is_passed("alg", "digest")
+
+    def test_digest(self, tmp_path):
+        """Проверяет зависимость хэша от содержимого и наличия файлов"""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.write_text("a", encoding="utf-8")
+        second.write_text("", encoding="utf-8")
+        digest = BuildManifest.get_digest([str(first), str(second)])
+
+        assert digest == BuildManifest.get_digest([str(first), str(second)])
+        second.write_text("b", encoding="utf-8")
+        assert digest != BuildManifest.get_digest([str(first), str(second)])
+        second.unlink()
+        assert digest != BuildManifest.get_digest([str(first), str(second)])
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestBuildManifest"])
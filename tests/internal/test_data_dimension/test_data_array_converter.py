@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from src.internal.data_dimension.data_array_converter import DataArrayConverter
+from src.internal.data_dimension.data_dimension import DataDimension
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+
+
+def create_dimension(data_type, data_shape=DataShapeEnum.LIST):
+    return DataDimension(data_type=data_type, data_shape=data_shape)
+
+
+class TestDataArrayConverter:
+    """Набор тестов для проверки класса DataArrayConverter"""
+
+    @pytest.mark.parametrize(
+        "data_type, data_shape, value, kind",
+        [
+            (DataTypeEnum.INT, DataShapeEnum.LIST, [1, 2, 3], "i"),
+            (DataTypeEnum.FLOAT, DataShapeEnum.LIST, [1, 2.5], "f"),
+            (DataTypeEnum.BOOL, DataShapeEnum.LIST, [True, False], "b"),
+            (DataTypeEnum.STRING, DataShapeEnum.LIST, ["a", "bc"], "U"),
+            (DataTypeEnum.INT, DataShapeEnum.MATRIX, [[1, 2], [3, 4]], "i"),
+            (DataTypeEnum.FLOAT, DataShapeEnum.MATRIX, [[1.0], [2.0]], "f"),
+        ],
+    )
+    def test_to_array(self, data_type, data_shape, value, kind):
+        """Проверка преобразования списков и матриц в массивы"""
+        array = DataArrayConverter.to_array(
+            create_dimension(data_type, data_shape), value
+        )
+
+        assert isinstance(array, np.ndarray)
+        assert array.dtype.kind == kind
+        assert array.tolist() == value
+
+    @pytest.mark.parametrize(
+        "data_type, kind",
+        [
+            (DataTypeEnum.INT, "i"),
+            (DataTypeEnum.FLOAT, "f"),
+            (DataTypeEnum.BOOL, "b"),
+            (DataTypeEnum.STRING, "U"),
+        ],
+    )
+    def test_to_array_empty(self, data_type, kind):
+        """Проверка типа данных пустого массива"""
+        array = DataArrayConverter.to_array(create_dimension(data_type), [])
+
+        assert array.dtype.kind == kind
+        assert array.shape == (0,)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [1, None],
+            [1, 2**70],
+            [[1, 2], [3]],
+            [[1], None],
+        ],
+    )
+    def test_to_array_unchanged(self, value):
+        """Проверка возврата значения, не представимого массивом"""
+        data_dimension = create_dimension(
+            DataTypeEnum.INT,
+            DataShapeEnum.MATRIX if isinstance(value[0], list) else DataShapeEnum.LIST,
+        )
+
+        assert DataArrayConverter.to_array(data_dimension, value) is value
+
+    def test_to_list(self):
+        """Проверка преобразования массива в список"""
+        value = DataArrayConverter.to_list(np.arange(4).reshape(2, 2))
+
+        assert value == [[0, 1], [2, 3]]
+        assert isinstance(value[0][0], int)
+        assert DataArrayConverter.to_list(5) == 5
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestDataArrayConverter"])
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from src.internal.data_dimension.data_dimension import DataDimension
@@ -15,6 +16,31 @@ from tests import (
     SCALAR_CASES,
 )
 
+COMPILE_VALUES = [
+    None,
+    1,
+    1.5,
+    "str",
+    True,
+    (1, 2),
+    {"key": 1},
+    [],
+    [1, None, 2],
+    [1.0, 2],
+    [1, True],
+    ["a", "b"],
+    [[1, 2], [3, None]],
+    [[1.0], [2, "3"]],
+    [[True], [False]],
+    [[1], 2],
+    [[]],
+]
+DIMENSIONS = [
+    DataDimension(data_type=data_type, data_shape=data_shape)
+    for data_type in DataTypeEnum
+    for data_shape in DataShapeEnum
+]
+
 
 class TestDataDimensionChecker:
     """Набор тестов для проверки класса DataDimensionChecker"""
@@ -275,6 +301,129 @@ class TestDataDimensionChecker:
             data_dimension, [["string", test_case.value]]
         ) == ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(1, 0, DataTypeEnum.STRING)
 
+    @pytest.mark.parametrize(
+        "data_dimension",
+        DIMENSIONS,
+        ids=[f"{dim.data_type}-{dim.data_shape}" for dim in DIMENSIONS],
+    )
+    def test_compile(self, data_dimension):
+        """Проверка совпадения результатов скомпилированной функции проверки
+        и метода check_value"""
+        check_value = DataDimensionChecker.compile(data_dimension)
+
+        for value in COMPILE_VALUES:
+            assert check_value(value) == DataDimensionChecker.check_value(
+                data_dimension, value
+            )
+
+    @pytest.mark.parametrize(
+        "data_dimension, value, expected",
+        [
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.LIST
+                ),
+                np.arange(3),
+                None,
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.FLOAT, data_shape=DataShapeEnum.LIST
+                ),
+                np.arange(3),
+                None,
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.FLOAT, data_shape=DataShapeEnum.LIST
+                ),
+                np.ones(3),
+                None,
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.LIST
+                ),
+                np.ones(3),
+                ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(0, DataTypeEnum.INT),
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.LIST
+                ),
+                np.ones((2, 2), dtype=int),
+                ErrMsg.NOT_LIST_VALUE,
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.BOOL, data_shape=DataShapeEnum.MATRIX
+                ),
+                np.eye(2) > 0,
+                None,
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.STRING, data_shape=DataShapeEnum.MATRIX
+                ),
+                np.array([["a"]]),
+                None,
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.MATRIX
+                ),
+                np.array([[1, None]], dtype=object),
+                None,
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.MATRIX
+                ),
+                np.array([[1, "a"]], dtype=object),
+                ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(1, 0, DataTypeEnum.INT),
+            ),
+            (
+                DataDimension(
+                    data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.MATRIX
+                ),
+                np.zeros((0, 2), dtype=int),
+                ErrMsg.NOT_MATRIX_VALUE,
+            ),
+        ],
+    )
+    def test_compile_array(self, data_dimension, value, expected):
+        """Проверка массивов NumPy скомпилированной функцией проверки"""
+        check_value = DataDimensionChecker.compile(data_dimension)
+
+        assert check_value(value) == expected
+
+    def test_compile_item(self):
+        """Проверка функций проверки элементов списка и строк матрицы"""
+        check_item = DataDimensionChecker.compile_item(
+            DataDimension(data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.LIST)
+        )
+        check_row = DataDimensionChecker.compile_item(
+            DataDimension(data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.MATRIX)
+        )
+
+        assert check_item(0, 1) is None
+        assert check_item(0, None) is None
+        assert check_item(2, True) == ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(
+            2, DataTypeEnum.INT
+        )
+        assert check_row(0, [1, None]) is None
+        assert check_row(0, np.arange(2)) is None
+        assert check_row(1, 1) == ErrMsgTmpl.NOT_LIST_ROW.format(1)
+        assert check_row(1, [1, 1.5]) == ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(
+            1, 1, DataTypeEnum.INT
+        )
+        with pytest.raises(ValueError):
+            DataDimensionChecker.compile_item(
+                DataDimension(
+                    data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.SCALAR
+                )
+            )
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestDataDimensionChecker"])
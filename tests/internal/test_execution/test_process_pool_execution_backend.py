@@ -0,0 +1,170 @@
+import importlib.util
+
+import pytest
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import (
+    AlgorithmTimeoutError,
+    AlgorithmTypeError,
+    AlgorithmUnexpectedError,
+    AlgorithmValueError,
+)
+from src.internal.execution import ExecutionBackendEnum, ProcessPoolExecutionBackend
+from src.internal.schemas.data_element_schema import DataElementSchema
+from tests import FIB_NAME
+
+FUNC = """import os
+import time
+
+from src.internal.errors import AlgorithmValueError
+
+
+def main(x):
+    if x < 0:
+        raise AlgorithmValueError("negative")
+    if x == 0:
+        return {"y": 1 / x}
+    time.sleep(x - 1)
+    return {"y": os.getpid()}"""
+
+
+@pytest.fixture()
+def func_path(tmp_path):
+    """Создает файл с методом для выполнения в пуле процессов"""
+    path = tmp_path / "function.py"
+    path.write_text(FUNC, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture()
+def method(func_path):
+    """Импортирует метод из файла"""
+    spec = importlib.util.spec_from_file_location("function.py", func_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main
+
+
+@pytest.fixture()
+def backend(func_path):
+    """Создает пул процессов с предварительно импортированным методом"""
+    backend = ProcessPoolExecutionBackend(1, [func_path])
+    yield backend
+    backend.shutdown()
+
+
+class TestProcessPoolExecutionBackend:
+    """Тесты для класса ProcessPoolExecutionBackend."""
+
+    def test_default_pool_size(self):
+        """Проверяет создание пула по количеству процессоров"""
+        backend = ProcessPoolExecutionBackend()
+        try:
+            assert backend.pool_size > 0
+        finally:
+            backend.shutdown()
+
+    def test_execute(self, backend, method):
+        """Проверяет выполнение метода в рабочем процессе"""
+        first_pid = backend.execute(method, {"x": 1}, 0)["y"]
+
+        assert backend.execute(method, {"x": 1}, 0)["y"] == first_pid
+
+    def test_algorithm_error(self, backend, method):
+        """Проверяет передачу ошибки алгоритма из рабочего процесса"""
+        with pytest.raises(AlgorithmValueError) as error:
+            backend.execute(method, {"x": -1}, 0)
+        assert str(error.value) == "negative"
+
+    def test_unexpected_error(self, backend, method):
+        """Проверяет передачу непредвиденной ошибки из рабочего процесса"""
+        with pytest.raises(AlgorithmUnexpectedError) as error:
+            backend.execute(method, {"x": 0}, 0)
+        assert str(error.value) == ErrMsg.UNEXPECTED_ERROR
+
+    def test_unexpected_param(self, backend, method):
+        """Проверяет ошибку при передаче недопустимого параметра"""
+        with pytest.raises(AlgorithmTypeError) as error:
+            backend.execute(method, {"x": 1, "z": 1}, 0)
+        assert str(error.value) == ErrMsg.UNEXPECTED_PARAM
+
+    def test_timeout(self, backend, method):
+        """Проверяет завершение рабочего процесса по истечению таймаута"""
+        first_pid = backend.execute(method, {"x": 1}, 0)["y"]
+        timeout = 1
+
+        with pytest.raises(AlgorithmTimeoutError) as error:
+            backend.execute(method, {"x": 10}, timeout)
+        assert str(error.value) == ErrMsgTmpl.TIME_OVER.format(timeout)
+
+        assert backend.execute(method, {"x": 1}, 0)["y"] != first_pid
+
+    def test_execute_many(self, func_path, method):
+        """Проверяет параллельное выполнение наборов входных данных и возврат
+        ошибок в порядке наборов"""
+        backend = ProcessPoolExecutionBackend(2, [func_path])
+        try:
+            results = list(
+                backend.execute_many(
+                    method, [{"x": 2}, {"x": -1}, {"x": 2}, {"x": 0}], 0
+                )
+            )
+        finally:
+            backend.shutdown()
+
+        assert results[0]["y"] != results[2]["y"]
+        assert isinstance(results[1], AlgorithmValueError)
+        assert str(results[1]) == "negative"
+        assert isinstance(results[3], AlgorithmUnexpectedError)
+
+    def test_execute_generator(self, backend, tmp_path):
+        """Проверяет вычисление генератора в рабочем процессе"""
+        path = tmp_path / "generator.py"
+        path.write_text(
+            "def main(x):\n    return {'y': (i for i in range(x))}", encoding="utf-8"
+        )
+        spec = importlib.util.spec_from_file_location("generator.py", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        assert backend.execute_stream(module.main, {"x": 3}, 0) == {"y": [0, 1, 2]}
+
+    def test_invalidate(self, backend, method, func_path):
+        """Проверяет повторный импорт измененного файла в рабочем процессе"""
+        pid = backend.execute(method, {"x": 1}, 0)
+        with open(func_path, "w", encoding="utf-8") as file:
+            file.write("def main(x):\n    return {'y': -x}")
+
+        assert backend.execute(method, {"x": 1}, 0) == pid
+        backend.invalidate(func_path)
+        assert backend.execute(method, {"x": 1}, 0) == {"y": -1}
+
+    def test_not_importable_method(self, backend):
+        """Проверяет выполнение вложенной функции в вызывающем потоке"""
+
+        def method(x):
+            return {"y": x}
+
+        assert backend.execute(method, {"x": 1}, 0) == {"y": 1}
+
+    def test_collection(self, fib_algo_dir, tmp_path):
+        """Проверяет выполнение алгоритмов коллекции в пуле процессов"""
+        algo_collection = AlgorithmCollection(
+            str(tmp_path),
+            execution_backend=ExecutionBackendEnum.PROCESS,
+            process_pool_size=1,
+        )
+        try:
+            result = algo_collection.get_algorithm_result(
+                FIB_NAME, [DataElementSchema(name="n", value=10)]
+            )
+        finally:
+            algo_collection.shutdown()
+
+        assert result == [DataElementSchema(name="result", value=55)]
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestProcessPoolExecutionBackend"])
@@ -0,0 +1,114 @@
+import time
+
+import pytest
+
+from src.internal.algorithm_executor import AlgorithmExecutor
+from src.internal.result_cache import HITS, MISSES, ResultCache
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+
+class TestResultCache:
+    """Тесты для класса ResultCache."""
+
+    def test_get_missed(self):
+        """Проверяет отсутствие результата в пустом кэше"""
+        cache = ResultCache()
+
+        assert cache.get("alg", {"x": 1}) is None
+        assert cache.get_statistics() == {"alg": {HITS: 0, MISSES: 1}}
+
+    def test_put_get(self):
+        """Проверяет получение сохраненного результата"""
+        cache = ResultCache()
+        cache.put("alg", {"x": 1, "z": [1, 2]}, {"y": 1})
+
+        assert cache.get("alg", {"z": [1, 2], "x": 1}) == {"y": 1}
+        assert cache.get("other", {"x": 1, "z": [1, 2]}) is None
+        assert cache.get_statistics() == {
+            "alg": {HITS: 1, MISSES: 0},
+            "other": {HITS: 0, MISSES: 1},
+        }
+
+    def test_distinct_value_types(self):
+        """Проверяет различие ключей для значений разных типов"""
+        cache = ResultCache()
+        cache.put("alg", {"x": 1}, {"y": 1})
+
+        assert cache.get("alg", {"x": True}) is None
+        assert cache.get("alg", {"x": 1.0}) is None
+        assert cache.get("alg", {"x": "1"}) is None
+
+    def test_lru_eviction(self):
+        """Проверяет вытеснение давно не используемых записей"""
+        cache = ResultCache(max_size=2)
+        cache.put("alg", {"x": 1}, {"y": 1})
+        cache.put("alg", {"x": 2}, {"y": 2})
+        cache.get("alg", {"x": 1})
+        cache.put("alg", {"x": 3}, {"y": 3})
+
+        assert len(cache) == 2
+        assert cache.get("alg", {"x": 1}) == {"y": 1}
+        assert cache.get("alg", {"x": 2}) is None
+
+    def test_ttl(self):
+        """Проверяет истечение времени жизни записи"""
+        cache = ResultCache(ttl=0.01)
+        cache.put("alg", {"x": 1}, {"y": 1})
+        time.sleep(0.02)
+
+        assert cache.get("alg", {"x": 1}) is None
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        """Проверяет удаление результатов алгоритма"""
+        cache = ResultCache()
+        cache.put("alg", {"x": 1}, {"y": 1})
+        cache.put("other", {"x": 1}, {"y": 1})
+        cache.invalidate("alg")
+
+        assert cache.get("alg", {"x": 1}) is None
+        assert cache.get("other", {"x": 1}) == {"y": 1}
+
+    def test_executor_uses_cache(self, create_algo_definition):
+        """Проверяет повторное использование результата выполнения алгоритма"""
+        calls = []
+
+        def method(x):
+            calls.append(x)
+            return {"y": x}
+
+        cache = ResultCache()
+        algo_executor = AlgorithmExecutor(
+            create_algo_definition(), method, result_cache=cache
+        )
+        params = [DataElementSchema(name="x", value=10)]
+
+        assert algo_executor.execute(params) == [DataElementSchema(name="y", value=10)]
+        assert algo_executor.execute(params) == [DataElementSchema(name="y", value=10)]
+        assert calls.count(10) == 1
+
+    def test_executor_bypass_non_deterministic(
+        self, create_algo_definition, create_scalar_int_output_definition
+    ):
+        """Проверяет отключение кэша для недетерминированного алгоритма"""
+        calls = []
+
+        def method(x):
+            calls.append(x)
+            return {"y": x}
+
+        cache = ResultCache()
+        algo_definition = create_algo_definition(
+            outputs=[create_scalar_int_output_definition("y", is_deterministic=False)]
+        )
+        algo_executor = AlgorithmExecutor(algo_definition, method, result_cache=cache)
+        params = [DataElementSchema(name="x", value=10)]
+        algo_executor.execute(params)
+        algo_executor.execute(params)
+
+        assert calls.count(10) == 2
+        assert len(cache) == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestResultCache"])
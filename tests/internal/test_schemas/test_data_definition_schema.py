@@ -64,6 +64,36 @@ class TestDataDefinitionSchema(TestDefinitionSchema):
         assert data_definition.data_shape == data_shape
         assert data_definition.default_value == default_value
 
+    def test_as_array(self):
+        """Проверка флага передачи значения в виде массива"""
+        data_definition = DataDefinitionSchema(
+            name=NAME,
+            title=TITLE,
+            description=DESCRIPTION,
+            data_type=DataTypeEnum.INT,
+            data_shape=DataShapeEnum.LIST,
+            default_value=[1],
+            as_array=True,
+        )
+        assert data_definition.as_array
+        assert "as_array" not in data_definition.model_dump()
+
+    def test_scalar_as_array(self):
+        """Проверка запрета передачи скалярного значения в виде массива"""
+        with pytest.raises(ValidationError) as error:
+            DataDefinitionSchema(
+                name=NAME,
+                title=TITLE,
+                description=DESCRIPTION,
+                data_type=DataTypeEnum.INT,
+                data_shape=DataShapeEnum.SCALAR,
+                default_value=1,
+                as_array=True,
+            )
+        assert (
+            error.value.errors()[0]["msg"] == "Value error, " + ErrMsg.SCALAR_AS_ARRAY
+        )
+
     def test_immutable_entity(self):
         """Проверка на неизменяемость объекта"""
         data_definition = DataDefinitionSchema(
@@ -0,0 +1,73 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import Settings
+from src.internal.constants import ADMIN_ENDPOINT, ALGORITHMS_ENDPOINT
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.schemas.catalog_reload_schema import CatalogReloadSchema
+from src.main import create_app
+from tests import (
+    BOOL_DEF,
+    BOOL_FUNC,
+    BOOL_NAME,
+    MOCK_TESTS,
+    SUM_DEF,
+    SUM_FUNC,
+    SUM_NAME,
+)
+
+ADMIN_TOKEN = "secret"
+
+
+@pytest.fixture()
+def admin_client(tmp_path, algo_dir):
+    """Создает клиента для тестирования с заданным токеном администратора"""
+    algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+    test_settings = Settings(
+        EXECUTE_TIMEOUT=0,
+        ALGORITHMS_CATALOG_PATH=str(tmp_path),
+        USE_LOGGER=False,
+        ADMIN_TOKEN=ADMIN_TOKEN,
+    )
+    app = create_app(test_settings)
+
+    yield TestClient(app)
+
+
+class TestAdmin:
+    """Тесты для конечных точек администрирования."""
+
+    def test_reload(self, admin_client, algo_dir):
+        """Проверяет повторную загрузку каталога алгоритмов"""
+        algo_dir(BOOL_NAME, BOOL_DEF, BOOL_FUNC, MOCK_TESTS)
+
+        response = admin_client.post(
+            ADMIN_ENDPOINT + "/reload", headers={"X-Admin-Token": ADMIN_TOKEN}
+        )
+
+        assert response.status_code == 200
+        assert CatalogReloadSchema.model_validate(
+            response.json()
+        ) == CatalogReloadSchema(added=[BOOL_NAME])
+        response = admin_client.get(f"{ALGORITHMS_ENDPOINT}/{BOOL_NAME}")
+        assert response.status_code == 200
+
+    def test_invalid_token(self, admin_client):
+        """Проверяет отклонение запроса с неверным токеном"""
+        response = admin_client.post(
+            ADMIN_ENDPOINT + "/reload", headers={"X-Admin-Token": "wrong"}
+        )
+
+        assert response.status_code == 403
+        assert response.json()["detail"] == ErrMsg.INVALID_ADMIN_TOKEN
+
+    def test_disabled(self, client):
+        """Проверяет недоступность администрирования без токена"""
+        response = client.post(ADMIN_ENDPOINT + "/reload")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == ErrMsg.ADMIN_DISABLED
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestAdmin"])
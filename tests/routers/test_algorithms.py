@@ -3,11 +3,13 @@ import json
 import pytest
 
 from src.internal.constants import ALGORITHMS_ENDPOINT
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementsSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
 from src.routers.schemas import AlgorithmsPageSchema
-from tests import BOOL_DEF, BOOL_NAME, FIB_DEF, SUM_DEF, SUM_NAME
+from src.routers.streaming import NDJSON_MEDIA_TYPE
+from tests import BOOL_DEF, BOOL_NAME, FIB_DEF, MOCK_TESTS, SUM_DEF, SUM_FUNC, SUM_NAME
 
 
 class TestAlgorithms:
@@ -39,6 +41,48 @@ class TestAlgorithms:
         assert AlgorithmDefinitionSchema.model_validate(response.json())
         assert response.json() == SUM_DEF
 
+    def test_get_algorithms_not_modified(self, client):
+        response = client.get(ALGORITHMS_ENDPOINT)
+        etag = response.headers["ETag"]
+
+        response = client.get(ALGORITHMS_ENDPOINT, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        response = client.get(
+            ALGORITHMS_ENDPOINT,
+            params={"size": 1},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_algorithm_not_modified(self, client):
+        response = client.get(f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}")
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}",
+            headers={"If-None-Match": f'"other", W/{etag}'},
+        )
+        assert response.status_code == 304
+
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/{BOOL_NAME}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json() == BOOL_DEF
+
+    def test_get_algorithms_after_reload(self, client, algo_dir):
+        etag = client.get(ALGORITHMS_ENDPOINT).headers["ETag"]
+        algo_dir("sum_copy", {**SUM_DEF, "name": "sum_copy"}, SUM_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+
+        response = client.get(ALGORITHMS_ENDPOINT, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert AlgorithmsPageSchema.model_validate(response.json()).total == 4
+
     def test_get_not_existed_algorithm(self, client):
         response = client.get(ALGORITHMS_ENDPOINT + "/not_existed")
         assert response.status_code == 404
@@ -100,6 +144,70 @@ class TestAlgorithms:
         )
         assert response.status_code == 400
 
+    def test_get_algorithm_batch_result(self, client):
+        parameters = json.dumps(
+            [
+                [{"name": "a", "value": 1}, {"name": "b", "value": 2}],
+                [{"name": "a", "value": 1}],
+                [{"name": "a", "value": 3}, {"name": "b", "value": 4}],
+            ]
+        )
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results:batch", data=parameters
+        )
+        assert response.status_code == 200
+        assert response.json() == [
+            {"outputs": [{"name": "result", "value": 3}], "error": None},
+            {"outputs": None, "error": ErrMsgTmpl.MISSED_PARAMETER.format("b")},
+            {"outputs": [{"name": "result", "value": 7}], "error": None},
+        ]
+
+    def test_get_not_existed_algorithm_batch_result(self, client):
+        response = client.post(
+            ALGORITHMS_ENDPOINT + "/not_existed/results:batch", data="[]"
+        )
+        assert response.status_code == 404
+
+    def test_get_algorithm_result_ndjson(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            data=parameters,
+            headers={"Accept": NDJSON_MEDIA_TYPE},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == NDJSON_MEDIA_TYPE
+        assert [json.loads(line) for line in response.iter_lines()] == [
+            {"name": "result", "value": 3}
+        ]
+
+    def test_get_algorithm_result_ndjson_missed_param(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}])
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            data=parameters,
+            headers={"Accept": NDJSON_MEDIA_TYPE},
+        )
+        assert response.status_code == 400
+
+    def test_get_algorithm_batch_result_ndjson(self, client):
+        parameters = json.dumps(
+            [
+                [{"name": "a", "value": 1}, {"name": "b", "value": 2}],
+                [{"name": "a", "value": 1}],
+            ]
+        )
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results:batch",
+            data=parameters,
+            headers={"Accept": NDJSON_MEDIA_TYPE},
+        )
+        assert response.status_code == 200
+        assert [json.loads(line) for line in response.iter_lines()] == [
+            {"outputs": [{"name": "result", "value": 3}], "error": None},
+            {"outputs": None, "error": ErrMsgTmpl.MISSED_PARAMETER.format("b")},
+        ]
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestAlgorithms"])
@@ -0,0 +1,59 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.internal.errors import AlgorithmValueError
+from src.internal.schemas.data_element_schema import DataElementSchema
+from src.routers.fast_json import (
+    FastJSONResponse,
+    dumps,
+    get_batch_result_content,
+    get_elements_content,
+)
+
+
+class TestFastJson:
+    """Тесты для сериализации результатов выполнения алгоритмов."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            [{"name": "result", "value": 55}],
+            [{"name": "result", "value": [[1.5, 2.0], [3.0, 4.0]]}],
+            [{"name": "result", "value": "Числа"}],
+            [{"name": "result", "value": 2**100}],
+        ],
+    )
+    def test_dumps(self, content):
+        """Проверяет сериализацию значений, в том числе больших целых чисел"""
+        assert json.loads(dumps(content)) == content
+
+    def test_dumps_array(self):
+        """Проверяет сериализацию массива numpy"""
+        assert json.loads(dumps({"value": np.array([1, 2])})) == {"value": [1, 2]}
+
+    def test_response(self):
+        """Проверяет ответ с элементами данных"""
+        elements = [DataElementSchema(name="result", value=[1, 2])]
+        response = FastJSONResponse(get_elements_content(elements))
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == [{"name": "result", "value": [1, 2]}]
+
+    def test_batch_result_content(self):
+        """Проверяет представление результата и ошибки пакетного вызова"""
+        elements = [DataElementSchema(name="result", value=1)]
+
+        assert get_batch_result_content(elements) == {
+            "outputs": [{"name": "result", "value": 1}],
+            "error": None,
+        }
+        assert get_batch_result_content(AlgorithmValueError("error")) == {
+            "outputs": None,
+            "error": "error",
+        }
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestFastJson"])
@@ -0,0 +1,143 @@
+import io
+
+import msgpack
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import Settings
+from src.internal.constants import ALGORITHMS_ENDPOINT
+from src.main import create_app
+from src.routers.msgpack_format import MSGPACK_MEDIA_TYPE, NPY_EXT_CODE
+from tests import FIB_NAME, MOCK_TESTS
+
+SCALE_NAME = "scale"
+SCALE_DEF = {
+    "name": SCALE_NAME,
+    "title": SCALE_NAME,
+    "description": SCALE_NAME,
+    "parameters": [
+        {
+            "name": "m",
+            "title": "m",
+            "description": "m",
+            "data_type": "FLOAT",
+            "data_shape": "MATRIX",
+            "default_value": [[1.0]],
+            "as_array": True,
+        },
+    ],
+    "outputs": [
+        {
+            "name": "result",
+            "title": "result",
+            "description": "result",
+            "data_type": "FLOAT",
+            "data_shape": "MATRIX",
+            "default_value": [[2.0]],
+            "is_deterministic": True,
+        }
+    ],
+}
+SCALE_FUNC = """import numpy as np
+def main(m):
+    assert isinstance(m, np.ndarray)
+    return {'result': m * 2}"""
+
+
+def pack_array(array: np.ndarray) -> msgpack.ExtType:
+    """Кодирует массив в тип расширения MessagePack"""
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return msgpack.ExtType(NPY_EXT_CODE, buffer.getvalue())
+
+
+def unpack_array(code: int, data: bytes) -> np.ndarray:
+    """Декодирует массив из типа расширения MessagePack"""
+    assert code == NPY_EXT_CODE
+    return np.load(io.BytesIO(data), allow_pickle=False)
+
+
+@pytest.fixture()
+def msgpack_client(tmp_path, algo_dir, fib_algo_dir):
+    """Создает клиента для тестирования с алгоритмом, принимающим матрицу"""
+    algo_dir(SCALE_NAME, SCALE_DEF, SCALE_FUNC, MOCK_TESTS)
+    test_settings = Settings(
+        EXECUTE_TIMEOUT=0, ALGORITHMS_CATALOG_PATH=str(tmp_path), USE_LOGGER=False
+    )
+    app = create_app(test_settings)
+
+    yield TestClient(app)
+
+
+class TestMsgpackFormat:
+    """Тесты для передачи данных в формате MessagePack."""
+
+    def test_matrix(self, msgpack_client):
+        """Проверяет передачу матрицы в формате .npy"""
+        matrix = np.arange(6, dtype=np.float64).reshape(2, 3)
+        response = msgpack_client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SCALE_NAME}/results",
+            content=msgpack.packb([{"name": "m", "value": pack_array(matrix)}]),
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        result = msgpack.unpackb(response.content, ext_hook=unpack_array)
+        assert result[0]["name"] == "result"
+        np.testing.assert_array_equal(result[0]["value"], matrix * 2)
+
+    def test_matrix_list(self, msgpack_client):
+        """Проверяет передачу матрицы списками и получение результата в JSON"""
+        response = msgpack_client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SCALE_NAME}/results",
+            content=msgpack.packb([{"name": "m", "value": [[1.0, 2.0]]}]),
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{"name": "result", "value": [[2.0, 4.0]]}]
+
+    def test_wrong_dtype(self, msgpack_client):
+        """Проверяет ошибку при передаче массива с неверным типом элементов"""
+        response = msgpack_client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SCALE_NAME}/results",
+            content=msgpack.packb(
+                [{"name": "m", "value": pack_array(np.array([["a", "b"]]))}]
+            ),
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+        )
+
+        assert response.status_code == 400
+
+    def test_invalid_body(self, msgpack_client):
+        """Проверяет ошибку при некорректном теле запроса"""
+        response = msgpack_client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SCALE_NAME}/results",
+            content=b"\xc1",
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+        )
+        assert response.status_code == 422
+
+        response = msgpack_client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SCALE_NAME}/results",
+            content=msgpack.packb([{"value": 1}]),
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+        )
+        assert response.status_code == 422
+
+    def test_big_int(self, msgpack_client):
+        """Проверяет передачу в формате JSON целых чисел больше 64 бит"""
+        response = msgpack_client.post(
+            f"{ALGORITHMS_ENDPOINT}/{FIB_NAME}/results",
+            json=[{"name": "n", "value": 100}],
+            headers={"Accept": MSGPACK_MEDIA_TYPE},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{"name": "result", "value": 354224848179261915075}]
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestMsgpackFormat"])